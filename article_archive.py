@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+날짜별로 나눈 열 기반(Parquet) 기사 보관소 모듈
+"""
+import os
+import uuid
+from datetime import datetime
+
+from url_frontier import article_idx
+
+
+DEFAULT_ARCHIVE_DIR = 'hanmi_archive'
+
+# 보관 열 순서 (target_date는 폴더 이름으로 저장되는 분할 열)
+ARCHIVE_COLUMNS = ('idx', 'url', 'title', 'author', 'date', 'categories', 'content', 'crawled_at')
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError:
+        raise Exception(
+            "기사 보관소를 사용하려면 pyarrow 패키지를 설치해야 합니다.\n"
+            "   pip install pyarrow"
+        )
+    return pyarrow
+
+
+class ArticleArchive:
+    """수집 날짜(target_date)별 폴더에 Parquet 파일로 기사를 쌓아 두는 보관소
+
+    hanmi_archive/target_date=2026-02-01/part-143015-<id>.parquet
+
+    저자와 분류 열은 사전(dictionary) 인코딩, 본문은 zstd로 압축한다.
+    파일은 임시 이름으로 다 쓴 뒤 이름을 바꿔 추가하므로 읽는 쪽에서
+    쓰다 만 파일을 보는 일이 없다. 읽을 때는 필요한 열과 날짜 폴더만 읽는다.
+    """
+
+    def __init__(self, directory=DEFAULT_ARCHIVE_DIR, compression='zstd'):
+        pa = _require_pyarrow()
+        self.directory = directory
+        self.compression = compression
+        self.schema = pa.schema([
+            ('idx', pa.string()),
+            ('url', pa.string()),
+            ('title', pa.string()),
+            ('author', pa.dictionary(pa.int32(), pa.string())),
+            ('date', pa.string()),
+            ('categories', pa.list_(pa.dictionary(pa.int32(), pa.string()))),
+            ('content', pa.string()),
+            ('crawled_at', pa.string()),
+        ])
+        self.partitioning = pa.dataset.partitioning(
+            pa.schema([('target_date', pa.string())]), flavor='hive'
+        )
+        os.makedirs(directory, exist_ok=True)
+
+    def _partition_dir(self, target_date):
+        return os.path.join(self.directory, f"target_date={target_date.isoformat()}")
+
+    def append(self, articles, target_date):
+        """해당 날짜 폴더에 기사 묶음을 새 파일로 추가, 파일 경로 반환 (기사가 없으면 None)"""
+        if not articles:
+            return None
+        pa = _require_pyarrow()
+
+        rows = []
+        for article in articles:
+            row = {column: article.get(column) for column in ARCHIVE_COLUMNS}
+            row['idx'] = article_idx(article['url'])
+            row['categories'] = list(article.get('categories') or [])
+            rows.append(row)
+        table = pa.Table.from_pylist(rows, schema=self.schema)
+
+        partition_dir = self._partition_dir(target_date)
+        os.makedirs(partition_dir, exist_ok=True)
+        name = f"part-{datetime.now().strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+        path = os.path.join(partition_dir, name)
+        # '.'으로 시작하는 임시 파일은 읽을 때 무시됨
+        tmp_path = os.path.join(partition_dir, f".{name}.tmp")
+        pa.parquet.write_table(
+            table, tmp_path,
+            compression=self.compression,
+            use_dictionary=['author', 'categories.list.element']
+        )
+        os.replace(tmp_path, path)
+        return path
+
+    def dates(self):
+        """보관된 날짜 목록 (오름차순)"""
+        days = []
+        for name in os.listdir(self.directory):
+            if name.startswith('target_date='):
+                days.append(datetime.strptime(name.split('=', 1)[1], '%Y-%m-%d').date())
+        return sorted(days)
+
+    def read(self, columns=None, start_date=None, end_date=None):
+        """필요한 열과 기간만 읽어 pyarrow Table로 반환
+
+        columns: 읽을 열 목록 (기본값: 전체, 'target_date' 포함 가능)
+        start_date, end_date: 읽을 기간 (해당 날짜 폴더만 읽음)
+        """
+        pa = _require_pyarrow()
+        dataset = pa.dataset.dataset(
+            self.directory, format='parquet', partitioning=self.partitioning,
+            schema=self.schema.append(pa.field('target_date', pa.string()))
+        )
+
+        condition = None
+        if start_date is not None:
+            condition = pa.dataset.field('target_date') >= start_date.isoformat()
+        if end_date is not None:
+            before_end = pa.dataset.field('target_date') <= end_date.isoformat()
+            condition = before_end if condition is None else condition & before_end
+
+        return dataset.to_table(columns=list(columns) if columns else None, filter=condition)
+
+    def articles(self, start_date=None, end_date=None):
+        """기간 안의 기사를 사전 목록으로 반환"""
+        table = self.read(columns=list(ARCHIVE_COLUMNS) + ['target_date'],
+                          start_date=start_date, end_date=end_date)
+        return table.to_pylist()
@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+"""
+HTML 파서 백엔드 모듈
+
+모든 백엔드는 같은 인터페이스를 가지며 같은 결과를 돌려준다.
+    parse(html, stage)          -> 문서 객체
+    has_markup(doc, stage)      -> 추출에 필요한 요소가 있는지 여부
+    list_entries(doc)           -> 목록 페이지 li 항목 [{'href', 'date', 'title'}]
+    main_entries(doc)           -> 메인 페이지 탭 항목 [{'href', 'date', 'title'}]
+    extract_article(doc)        -> {'title', 'content', 'date', 'author', 'rules'}
+stage는 'list', 'main', 'article' 중 하나이다.
+rules에는 필드별로 어떤 규칙(예: 'og:title', 'fr-view', 'info-text')이 적용되었는지
+기록되며, 아무 규칙도 맞지 않으면 'none'이다.
+"""
+import re
+
+
+# 기사 정보 영역의 "등록 2026-02-01 14:14:16" 형식
+REGIST_DATE_PATTERN = re.compile(r'등록\s+(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})')
+
+# 목록/메인 페이지는 li 항목만 있으면 충분함
+LIST_STAGES = ('list', 'main')
+
+# 기사 추출 계획: 한 번의 순회에서 살펴볼 태그와 저자 표시 span 클래스
+ARTICLE_PLAN_TAGS = frozenset(['meta', 'title', 'div', 'ul', 'time', 'strong', 'span'])
+AUTHOR_SPAN_CLASSES = frozenset(['author', 'reporter', 'writer'])
+
+
+class SoupParser:
+    """BeautifulSoup 기반 파서 (html.parser 또는 lxml 트리 빌더)"""
+
+    def __init__(self, features='html.parser'):
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        self.name = features
+        self.features = features
+        self._soup_class = BeautifulSoup
+        self._list_strainer = SoupStrainer('li')
+
+    def parse(self, html, stage):
+        # 목록 페이지는 li 하위 트리만 파싱
+        parse_only = self._list_strainer if stage in LIST_STAGES else None
+        return self._soup_class(html, self.features, parse_only=parse_only)
+
+    def has_markup(self, soup, stage):
+        # 추출할 때와 같은 조건 (class 값에 이름이 포함되면 일치)
+        if stage == 'list':
+            return soup.find('dd', class_=lambda x: x and 'registDate' in x) is not None
+        if stage == 'main':
+            return soup.find('li', class_=lambda x: x and 'tab_item' in x) is not None
+        return (
+            soup.find('meta', {'property': 'og:title'}) is not None
+            and soup.find('div', class_=['fr-view', 'viewContent']) is not None
+            and soup.find('ul', class_=lambda x: x and 'info-text' in x) is not None
+        )
+
+    def list_entries(self, soup):
+        entries = []
+        # li 태그 안에 링크와 날짜가 함께 있음
+        for li in soup.find_all('li'):
+            link = li.find('a', href=True)
+            if not link:
+                continue
+
+            # 같은 li 안에서 날짜 찾기 (dd.registDate)
+            date_dd = li.find('dd', class_=lambda x: x and 'registDate' in x)
+
+            # 제목 (dt.title > a)
+            title = None
+            title_dt = li.find('dt', class_=lambda x: x and 'title' in x)
+            if title_dt:
+                title_link = title_dt.find('a')
+                if title_link:
+                    title = title_link.get_text(strip=True)
+
+            entries.append({
+                'href': link['href'],
+                'date': date_dd.get_text(strip=True) if date_dd else None,
+                'title': title,
+            })
+        return entries
+
+    def main_entries(self, soup):
+        entries = []
+        # tab_item 클래스를 가진 li 태그
+        for li in soup.find_all('li', class_=lambda x: x and 'tab_item' in x):
+            link = li.find('a', href=True)
+            if not link:
+                continue
+
+            # 같은 li 안에서 날짜 찾기 (span.tab_data > time.time)
+            time_tag = li.find('time', class_=lambda x: x and 'time' in x)
+            title_tag = li.find('strong', class_=lambda x: x and 'headline' in x)
+
+            entries.append({
+                'href': link['href'],
+                'date': time_tag.get_text(strip=True) if time_tag else None,
+                'title': title_tag.get_text(strip=True) if title_tag else None,
+            })
+        return entries
+
+    def extract_article(self, soup):
+        """한 번의 트리 순회로 제목, 본문, 날짜, 저자를 함께 추출"""
+        scan = _ArticleScan(soup)
+        rules = {}
+        article = {}
+        article['title'], rules['title'] = self._resolve_title(scan)
+        info = self._scan_info_text(scan.get('info-text'))
+        article['date'], rules['date'] = self._resolve_date(scan, info)
+        article['author'], rules['author'] = self._resolve_author(scan, info)
+        # 본문 정리(decompose)는 트리를 바꾸므로 순회가 끝난 뒤 마지막에 수행
+        article['content'], rules['content'] = self._resolve_content(scan)
+        article['rules'] = rules
+        return {key: article[key] for key in ('title', 'content', 'date', 'author', 'rules')}
+
+    def _scan_info_text(self, info_list):
+        """기사 정보 영역(ul.info-text)의 li를 한 번 돌며 등록일시와 기자 이름 찾기"""
+        info = {'date': None, 'author': None}
+        if info_list is None:
+            return info
+        for li in info_list.find_all('li'):
+            text = li.get_text(strip=True)
+            if info['date'] is None:
+                # "등록 2026-02-01 14:14:16" 형식
+                match = REGIST_DATE_PATTERN.search(text)
+                if match:
+                    info['date'] = f"{match.group(1)} {match.group(2)}"
+            if info['author'] is None and '기자' in text and '등록' not in text:
+                # "김영 기자" 형식
+                info['author'] = text
+        return info
+
+    def _resolve_title(self, scan):
+        """제목: og:title 메타 태그 → title 태그"""
+        meta_title = scan.get('og:title')
+        if meta_title is not None and meta_title.get('content'):
+            return meta_title['content'], 'og:title'
+        title_tag = scan.get('title')
+        if title_tag is not None:
+            return title_tag.get_text(strip=True), 'title'
+        return "제목 없음", 'none'
+
+    def _resolve_content(self, scan):
+        """본문: div.fr-view → div.viewContent (스크립트, 스타일 태그 제거)"""
+        content_div = scan.get('fr-view')
+        if content_div is not None:
+            for script in content_div(['script', 'style', 'img']):
+                script.decompose()
+            return content_div.get_text(strip=True, separator='\n'), 'fr-view'
+
+        content_div = scan.get('viewContent')
+        if content_div is not None:
+            for script in content_div(['script', 'style']):
+                script.decompose()
+            return content_div.get_text(strip=True, separator='\n'), 'viewContent'
+
+        return "본문 없음", 'none'
+
+    def _resolve_date(self, scan, info):
+        """날짜: 기사 정보 영역 → article:published_time 메타 태그 → time 태그"""
+        if info['date']:
+            return info['date'], 'info-text'
+        meta_date = scan.get('published_time')
+        if meta_date is not None and meta_date.get('content'):
+            return meta_date['content'], 'published_time'
+        time_tag = scan.get('time')
+        if time_tag is not None:
+            return time_tag.get_text(strip=True), 'time'
+        return None, 'none'
+
+    def _resolve_author(self, scan, info):
+        """저자: 기사 정보 영역 → 하단 프로필(strong.writer) → author 메타 태그 → 저자 표시 span"""
+        if info['author']:
+            return info['author'], 'info-text'
+        writer_strong = scan.get('writer')
+        if writer_strong is not None:
+            return writer_strong.get_text(strip=True), 'writer'
+        meta_author = scan.get('meta_author')
+        if meta_author is not None and meta_author.get('content'):
+            return meta_author['content'], 'meta_author'
+        author_span = scan.get('author_span')
+        if author_span is not None:
+            return author_span.get_text(strip=True), 'author_span'
+        return None, 'none'
+
+
+class _ArticleScan:
+    """기사 페이지의 규칙별 후보 요소(문서 순서상 첫 번째)를 수집하는 단일 순회
+
+    트리는 한 번만, 그리고 요청된 요소를 찾을 때까지만 순회한다.
+    주요 규칙(og:title, ul.info-text 등)이 앞쪽에서 모두 맞으면 나머지
+    문서는 보지 않고, 대체 규칙이 필요할 때만 멈춘 지점부터 이어서 순회한다.
+    """
+
+    def __init__(self, soup):
+        self.found = {}
+        self._nodes = soup.descendants
+
+    def get(self, key):
+        while key not in self.found and self._nodes is not None:
+            node = next(self._nodes, None)
+            if node is None:
+                self._nodes = None
+            elif node.name in ARTICLE_PLAN_TAGS:
+                self._classify(node)
+        return self.found.get(key)
+
+    def _classify(self, tag):
+        found = self.found
+        name = tag.name
+        if name == 'meta':
+            prop = tag.get('property')
+            if prop == 'og:title':
+                found.setdefault('og:title', tag)
+            elif prop == 'article:published_time':
+                found.setdefault('published_time', tag)
+            if tag.get('name') == 'author':
+                found.setdefault('meta_author', tag)
+        elif name == 'div':
+            classes = tag.get('class') or ()
+            if 'fr-view' in classes:
+                found.setdefault('fr-view', tag)
+            if 'viewContent' in classes:
+                found.setdefault('viewContent', tag)
+        elif name == 'ul':
+            if _class_contains(tag, 'info-text'):
+                found.setdefault('info-text', tag)
+        elif name == 'strong':
+            if _class_contains(tag, 'writer'):
+                found.setdefault('writer', tag)
+        elif name == 'span':
+            if AUTHOR_SPAN_CLASSES.intersection(tag.get('class') or ()):
+                found.setdefault('author_span', tag)
+        else:
+            # title, time
+            found.setdefault(name, tag)
+
+
+def _class_contains(tag, name):
+    """class 값 중 하나에 name이 포함되어 있는지 확인"""
+    for value in tag.get('class') or ():
+        if name in value:
+            return True
+    return False
+
+
+# selectolax 텍스트 추출 시 제외할 태그 (BeautifulSoup get_text와 동일하게)
+_NON_TEXT_TAGS = ('script', 'style', 'template')
+
+
+def _node_text(node, separator=''):
+    """BeautifulSoup get_text(strip=True, separator=...)와 같은 결과"""
+    parts = []
+    for child in node.traverse(include_text=True):
+        if child.tag != '-text' or child.parent.tag in _NON_TEXT_TAGS:
+            continue
+        text = child.text_content.strip()
+        if text:
+            parts.append(text)
+    return separator.join(parts)
+
+
+class SelectolaxParser:
+    """selectolax(lexbor, C 구현) 기반 파서"""
+
+    name = 'selectolax'
+
+    def __init__(self):
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError:
+            raise Exception(
+                "selectolax 파서를 사용하려면 패키지를 설치해야 합니다.\n"
+                "   pip install selectolax"
+            )
+        self._parser_class = LexborHTMLParser
+
+    def parse(self, html, stage):
+        return self._parser_class(html)
+
+    def has_markup(self, tree, stage):
+        # 추출할 때와 같은 선택자 (SoupParser와 같은 결과)
+        if stage == 'list':
+            return tree.css_first('dd[class*="registDate"]') is not None
+        if stage == 'main':
+            return tree.css_first('li[class*="tab_item"]') is not None
+        return (
+            tree.css_first('meta[property="og:title"]') is not None
+            and tree.css_first('div.fr-view, div.viewContent') is not None
+            and tree.css_first('ul[class*="info-text"]') is not None
+        )
+
+    def list_entries(self, tree):
+        entries = []
+        for li in tree.css('li'):
+            link = li.css_first('a[href]')
+            if link is None:
+                continue
+
+            date_dd = li.css_first('dd[class*="registDate"]')
+
+            title = None
+            title_dt = li.css_first('dt[class*="title"]')
+            if title_dt is not None:
+                title_link = title_dt.css_first('a')
+                if title_link is not None:
+                    title = _node_text(title_link)
+
+            entries.append({
+                'href': link.attributes.get('href') or '',
+                'date': _node_text(date_dd) if date_dd is not None else None,
+                'title': title,
+            })
+        return entries
+
+    def main_entries(self, tree):
+        entries = []
+        for li in tree.css('li[class*="tab_item"]'):
+            link = li.css_first('a[href]')
+            if link is None:
+                continue
+
+            time_tag = li.css_first('time[class*="time"]')
+            title_tag = li.css_first('strong[class*="headline"]')
+
+            entries.append({
+                'href': link.attributes.get('href') or '',
+                'date': _node_text(time_tag) if time_tag is not None else None,
+                'title': _node_text(title_tag) if title_tag is not None else None,
+            })
+        return entries
+
+    def extract_article(self, tree):
+        rules = {}
+        article = {}
+        article['title'], rules['title'] = self._extract_title(tree)
+        article['content'], rules['content'] = self._extract_content(tree)
+        info = self._scan_info_text(tree.css_first('ul[class*="info-text"]'))
+        article['date'], rules['date'] = self._extract_date(tree, info)
+        article['author'], rules['author'] = self._extract_author(tree, info)
+        article['rules'] = rules
+        return article
+
+    def _scan_info_text(self, info_list):
+        info = {'date': None, 'author': None}
+        if info_list is None:
+            return info
+        for li in info_list.css('li'):
+            text = _node_text(li)
+            if info['date'] is None:
+                match = REGIST_DATE_PATTERN.search(text)
+                if match:
+                    info['date'] = f"{match.group(1)} {match.group(2)}"
+            if info['author'] is None and '기자' in text and '등록' not in text:
+                info['author'] = text
+        return info
+
+    def _extract_title(self, tree):
+        meta_title = tree.css_first('meta[property="og:title"]')
+        if meta_title is not None and meta_title.attributes.get('content'):
+            return meta_title.attributes['content'], 'og:title'
+
+        title_tag = tree.css_first('title')
+        if title_tag is not None:
+            return _node_text(title_tag), 'title'
+
+        return "제목 없음", 'none'
+
+    def _extract_content(self, tree):
+        content_div = tree.css_first('div.fr-view')
+        if content_div is not None:
+            for node in content_div.css('script, style, img'):
+                node.decompose()
+            return _node_text(content_div, separator='\n'), 'fr-view'
+
+        content_div = tree.css_first('div.viewContent')
+        if content_div is not None:
+            for node in content_div.css('script, style'):
+                node.decompose()
+            return _node_text(content_div, separator='\n'), 'viewContent'
+
+        return "본문 없음", 'none'
+
+    def _extract_date(self, tree, info):
+        if info['date']:
+            return info['date'], 'info-text'
+
+        meta_date = tree.css_first('meta[property="article:published_time"]')
+        if meta_date is not None and meta_date.attributes.get('content'):
+            return meta_date.attributes['content'], 'published_time'
+
+        time_tag = tree.css_first('time')
+        if time_tag is not None:
+            return _node_text(time_tag), 'time'
+
+        return None, 'none'
+
+    def _extract_author(self, tree, info):
+        if info['author']:
+            return info['author'], 'info-text'
+
+        writer_strong = tree.css_first('strong[class*="writer"]')
+        if writer_strong is not None:
+            return _node_text(writer_strong), 'writer'
+
+        meta_author = tree.css_first('meta[name="author"]')
+        if meta_author is not None and meta_author.attributes.get('content'):
+            return meta_author.attributes['content'], 'meta_author'
+
+        author_span = tree.css_first('span.author, span.reporter, span.writer')
+        if author_span is not None:
+            return _node_text(author_span), 'author_span'
+
+        return None, 'none'
+
+
+# 사용 가능한 파서 백엔드
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+
+def get_parser(name='lxml'):
+    """이름으로 파서 백엔드 생성"""
+    if name in ('html.parser', 'lxml'):
+        return SoupParser(name)
+    if name == 'selectolax':
+        return SelectolaxParser()
+    raise ValueError(f"지원하지 않는 파서입니다: {name} (사용 가능: {', '.join(PARSER_BACKENDS)})")
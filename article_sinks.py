@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+수집된 기사를 하나씩 받아 처리하는 출력 대상(sink) 모듈
+"""
+import json
+import os
+from datetime import datetime
+
+
+class ArticleSink:
+    """기사 스트림을 받는 출력 대상의 기본 형태
+
+    크롤러는 첫 기사가 수집될 때 open(crawler, total)을, 기사가 하나
+    수집될 때마다 write(article)를, 실행이 끝나거나 중단되면 close()를 호출한다.
+    목록 탐색과 상세 수집이 동시에 진행되므로 total은 None일 수 있다
+    (그때까지 발견한 기사 수는 crawler.discovered_count).
+    """
+
+    def open(self, crawler, total):
+        pass
+
+    def write(self, article):
+        pass
+
+    def close(self):
+        pass
+
+
+class JsonlSink(ArticleSink):
+    """기사를 한 줄에 하나씩 JSON으로 이어 쓰는 파일 출력
+
+    기사마다 버퍼를 비우고 fsync_every개마다 디스크에 동기화하므로
+    실행이 중간에 중단되어도 그때까지 수집한 기사가 남고,
+    실행 중에도 tail -f 등으로 진행 상황을 볼 수 있다.
+    path를 생략하면 hanmi_articles_YYYYMMDD_HHMMSS.jsonl 파일에 쓴다.
+    """
+
+    def __init__(self, path=None, fsync_every=10):
+        self.path = path
+        self.fsync_every = max(1, int(fsync_every))
+        self.count = 0
+        self._file = None
+        self._unsynced = 0
+
+    def open(self, crawler, total):
+        if self.path is None:
+            date_str = crawler.target_date.strftime('%Y%m%d')
+            timestamp = datetime.now().strftime('%H%M%S')
+            self.path = f"hanmi_articles_{date_str}_{timestamp}.jsonl"
+        self._file = open(self.path, 'a', encoding='utf-8')
+        print(f"✓ 수집 결과를 실시간으로 기록: {self.path}")
+
+    def write(self, article):
+        self._file.write(json.dumps(article, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.count += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        if self._file is None:
+            return
+        self._sync()
+        self._file.close()
+        self._file = None
+
+
+class ExcelSink(ArticleSink):
+    """기사를 수집되는 대로 엑셀 파일에 한 행씩 쓰는 출력 (기사를 메모리에 모으지 않음)
+
+    path를 생략하면 hanmi_articles_YYYYMMDD_HHMMSS.xlsx 파일에 쓴다.
+    """
+
+    def __init__(self, path=None, **writer_options):
+        self.path = path
+        self.writer_options = writer_options
+        self.writer = None
+
+    def open(self, crawler, total):
+        from excel_writer import ExcelArticleWriter
+
+        if self.path is None:
+            date_str = crawler.target_date.strftime('%Y%m%d')
+            timestamp = datetime.now().strftime('%H%M%S')
+            self.path = f"hanmi_articles_{date_str}_{timestamp}.xlsx"
+        self.writer = ExcelArticleWriter(self.path, **self.writer_options)
+
+    def write(self, article):
+        self.writer.write(article)
+
+    def close(self):
+        if self.writer is None:
+            return
+        for filename in self.writer.close():
+            print(f"✓ 엑셀 파일 저장 완료: {filename}")
+        self.writer = None
+
+
+class ProgressSink(ArticleSink):
+    """기사가 수집될 때마다 callback(완료 수, 전체 수, 기사) 호출
+
+    목록 탐색이 아직 끝나지 않았으면 전체 수는 지금까지 발견한 기사 수이다.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.crawler = None
+        self.total = 0
+        self.done = 0
+
+    def open(self, crawler, total):
+        self.crawler = crawler
+        self.total = total
+        self.done = 0
+
+    def write(self, article):
+        self.done += 1
+        total = self.total if self.total is not None else self.crawler.discovered_count
+        self.callback(self.done, total, article)
+
+
+class AggregateSink(ArticleSink):
+    """최종 엑셀/이메일 출력을 위해 기사를 모두 모아 두는 출력"""
+
+    def __init__(self, articles=None):
+        self.articles = articles if articles is not None else []
+
+    def write(self, article):
+        self.articles.append(article)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+HTML 파서 백엔드 비교 벤치마크
+
+각 백엔드의 추출 결과가 html.parser 결과와 같은지 확인하고 파싱 시간을 비교한다.
+
+    python benchmark_parsers.py
+    python benchmark_parsers.py --repeat 50 --list list.html --article view1.html view2.html
+"""
+import argparse
+import sys
+import time
+from datetime import date
+
+from article_parser import PARSER_BACKENDS, get_parser
+
+
+def _sample_list_page(items=40):
+    """목록 페이지 형태의 예제 HTML"""
+    today = date.today().strftime('%Y-%m-%d')
+    menu = ''.join(f'<li class="menu"><a href="/news/list.php?mcode=m{i}">메뉴 {i}</a></li>' for i in range(30))
+    rows = ''.join(
+        f'<li><dl><dt class="title"><a href="/news/view.php?idx={1000 + i}&amp;mcode=m93atmw">'
+        f'기사 제목 {i} &quot;인용&quot;</a></dt>'
+        f'<dd class="summary">요약 {i} ' + '내용 ' * 30 + '</dd>'
+        f'<dd class="registDate">{today}</dd></dl></li>'
+        for i in range(items)
+    )
+    scripts = '<script>var x = "<li>not a tag</li>";</script>' * 5
+    return (
+        f'<html><head><title>목록</title>{scripts}</head><body>'
+        f'<nav><ul>{menu}</ul></nav><div class="list"><ul>{rows}</ul></div>'
+        f'<footer>' + '<p>푸터</p>' * 50 + '</footer></body></html>'
+    )
+
+
+def _sample_article_page(paragraphs=120):
+    """기사 페이지 형태의 예제 HTML"""
+    body = ''.join(
+        f'<p>{i}번째 문단입니다. &lt;강조&gt; <b>굵게</b> 그리고 <a href="#">링크</a>.</p>'
+        + ('<img src="photo.jpg">' if i % 10 == 0 else '')
+        + ('<!-- 광고 -->' if i % 15 == 0 else '')
+        for i in range(paragraphs)
+    )
+    menu = ''.join(f'<li><a href="/news/list.php?mcode=m{i}">메뉴 {i}</a></li>' for i in range(60))
+    return (
+        '<html><head><meta property="og:title" content="테스트 기사 제목">'
+        '<meta name="author" content="홍길동"><title>한미일보</title></head><body>'
+        f'<nav><ul>{menu}</ul></nav>'
+        '<ul class="info-text"><li>김영 기자</li><li>등록 2026-02-01 14:14:16</li></ul>'
+        f'<div class="fr-view">{body}<script>alert(1)</script><style>p{{}}</style></div>'
+        '<strong class="writer">김영</strong></body></html>'
+    )
+
+
+def _run_stage(parser, html, stage):
+    doc = parser.parse(html, stage)
+    if stage == 'list':
+        return parser.list_entries(doc)
+    return parser.extract_article(doc)
+
+
+def benchmark(pages, repeat):
+    """백엔드별 결과 일치 여부와 평균 파싱 시간(ms) 계산"""
+    parsers = []
+    for name in PARSER_BACKENDS:
+        try:
+            parsers.append(get_parser(name))
+        except Exception as e:
+            print(f"- {name}: 사용할 수 없음 ({str(e).splitlines()[0]})")
+
+    reference = {i: _run_stage(get_parser('html.parser'), html, stage) for i, (stage, html) in enumerate(pages)}
+    all_match = True
+
+    print(f"\n{'파서':<12} {'단계':<8} {'평균(ms)':>10} {'결과 일치':>10}")
+    for parser in parsers:
+        for stage in ('list', 'article'):
+            stage_pages = [(i, html) for i, (s, html) in enumerate(pages) if s == stage]
+            if not stage_pages:
+                continue
+
+            match = all(_run_stage(parser, html, stage) == reference[i] for i, html in stage_pages)
+            all_match = all_match and match
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                for _, html in stage_pages:
+                    _run_stage(parser, html, stage)
+            elapsed_ms = (time.perf_counter() - started) * 1000 / (repeat * len(stage_pages))
+
+            print(f"{parser.name:<12} {stage:<8} {elapsed_ms:>10.2f} {'O' if match else 'X':>10}")
+
+    return all_match
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="HTML 파서 백엔드 비교")
+    arg_parser.add_argument('--repeat', type=int, default=20, help="반복 횟수")
+    arg_parser.add_argument('--list', nargs='*', default=[], help="목록 페이지 HTML 파일")
+    arg_parser.add_argument('--article', nargs='*', default=[], help="기사 페이지 HTML 파일")
+    args = arg_parser.parse_args()
+
+    pages = []
+    for stage, paths in (('list', args.list), ('article', args.article)):
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                pages.append((stage, f.read()))
+    if not pages:
+        pages = [('list', _sample_list_page()), ('article', _sample_article_page())]
+
+    if not benchmark(pages, max(1, args.repeat)):
+        print("\n✗ 백엔드 간 추출 결과가 다릅니다.")
+        sys.exit(1)
+    print("\n✓ 모든 백엔드의 추출 결과가 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
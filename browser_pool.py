@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Playwright 브라우저/페이지 풀 모듈
+"""
+import asyncio
+import json
+
+
+BROWSER_NOT_INSTALLED_MESSAGE = (
+    "Playwright 브라우저가 설치되어 있지 않습니다.\n\n"
+    "설치 방법:\n"
+    "1. 명령 프롬프트(cmd)를 관리자 권한으로 실행\n"
+    "2. 다음 명령어 입력:\n"
+    "   playwright install chromium\n\n"
+    "또는 install_browser.bat 파일을 실행하세요."
+)
+
+
+def endpoint_alive(endpoint, timeout=1.0):
+    """브라우저 서비스(CDP 엔드포인트)가 응답하는지 확인"""
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(endpoint.rstrip('/') + '/json/version', timeout=timeout) as response:
+            return 'webSocketDebuggerUrl' in json.loads(response.read().decode('utf-8'))
+    except Exception:
+        return False
+
+
+class BrowserPool:
+    """하나의 브라우저 위에서 최대 size개의 페이지(탭)를 열어 재사용
+
+    브라우저는 처음 페이지가 필요할 때 실행되므로, HTTP 모드처럼
+    브라우저가 필요 없는 실행에서는 Chromium이 아예 뜨지 않는다.
+    resource_filter가 주어지면 컨텍스트의 모든 요청에 적용된다.
+
+    endpoint(예: http://127.0.0.1:9222)를 주면 브라우저를 직접 띄우지 않고
+    browser_service.py로 실행해 둔 브라우저에 연결한다(응답이 없으면 직접 실행).
+    여러 번 실행하는 프로그램(GUI 등)은 실행이 끝날 때 close() 대신 reset()을
+    호출해 브라우저를 켜 둔 채로 다음 실행에 재사용할 수 있고, idle_timeout 초 동안
+    다시 쓰이지 않으면 브라우저를 종료한다.
+    profile(BrowserProfile)을 주면 매번 빈 프로필 대신 유지되는 프로필 폴더로
+    실행해 Chromium의 디스크 캐시와 쿠키를 다음 실행에도 사용한다.
+    """
+
+    def __init__(self, size=1, headless=True, resource_filter=None, endpoint=None, idle_timeout=None,
+                 profile=None):
+        self.size = max(1, int(size))
+        self.headless = headless
+        self.resource_filter = resource_filter
+        self.endpoint = endpoint
+        self.idle_timeout = idle_timeout
+        self.profile = profile
+        self.browser = None
+        self.context = None
+        self.connected = False
+        self._playwright = None
+        self._persistent = None
+        self._persistent_closed = False
+        self._pages = asyncio.Queue()
+        self._opened = []
+        self._created = 0
+        self._start_lock = asyncio.Lock()
+        self._idle_handle = None
+
+    @property
+    def started(self):
+        return self.context is not None
+
+    def _launched(self):
+        return self.browser is not None or self._persistent is not None
+
+    def is_healthy(self):
+        """브라우저가 실행 중이고 연결이 살아 있는지 확인"""
+        if self._persistent is not None:
+            return not self._persistent_closed
+        return self.browser is not None and self.browser.is_connected()
+
+    def configure(self, size=None, resource_filter=None):
+        """다음 실행에 사용할 페이지 수와 요청 차단 규칙 변경 (컨텍스트가 없을 때만 적용됨)"""
+        if size is not None:
+            self.size = max(1, int(size))
+        self.resource_filter = resource_filter
+
+    async def start(self):
+        """브라우저 실행 (이미 실행 중이면 무시)"""
+        async with self._start_lock:
+            self._cancel_idle_timer()
+            if self._launched() and not self.is_healthy():
+                # 브라우저가 죽었거나 서비스 연결이 끊긴 경우 새로 시작
+                print("  → 브라우저 연결이 끊어져 다시 시작합니다")
+                await self._shutdown()
+            if self.context is not None:
+                return
+
+            if not self._launched():
+                await self._launch()
+
+            if self._persistent is not None:
+                self.context = self._persistent
+            else:
+                self.context = await self.browser.new_context()
+            if self.resource_filter is not None:
+                await self.resource_filter.install(self.context)
+
+    async def _launch(self):
+        """브라우저 서비스에 연결하거나 직접 실행"""
+        # playwright는 브라우저가 실제로 필요할 때만 불러옴 (시작 시간 단축)
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        if self.endpoint:
+            if await asyncio.to_thread(endpoint_alive, self.endpoint):
+                try:
+                    self.browser = await self._playwright.chromium.connect_over_cdp(self.endpoint)
+                    self.connected = True
+                    return
+                except Exception as e:
+                    print(f"  ⚠️ 브라우저 서비스 연결 실패, 직접 실행합니다: {e}")
+            else:
+                print(f"  ⚠️ 브라우저 서비스({self.endpoint})가 응답하지 않아 직접 실행합니다")
+
+        if self.profile is not None:
+            try:
+                self._persistent = await self._playwright.chromium.launch_persistent_context(
+                    self.profile.directory, headless=self.headless, args=self.profile.launch_args()
+                )
+                self._persistent_closed = False
+                self._persistent.on('close', self._on_persistent_close)
+                return
+            except Exception as e:
+                if "Executable doesn't exist" in str(e):
+                    await self._playwright.stop()
+                    self._playwright = None
+                    raise Exception(BROWSER_NOT_INSTALLED_MESSAGE)
+                # 다른 브라우저가 같은 프로필을 사용 중인 경우 등
+                print(f"  ⚠️ 브라우저 프로필을 사용할 수 없어 임시 프로필로 실행합니다: {str(e).splitlines()[0]}")
+
+        try:
+            self.browser = await self._playwright.chromium.launch(headless=self.headless)
+            self.connected = False
+        except Exception as e:
+            await self._playwright.stop()
+            self._playwright = None
+            error_msg = str(e)
+            if "Executable doesn't exist" in error_msg or "browser" in error_msg.lower():
+                raise Exception(BROWSER_NOT_INSTALLED_MESSAGE)
+            raise
+
+    async def acquire(self):
+        """사용 가능한 페이지 가져오기 (없으면 새로 열거나 반환될 때까지 대기, 닫힌 페이지는 버림)"""
+        await self.start()
+        while True:
+            if self._pages.empty() and self._created < self.size:
+                self._created += 1
+                try:
+                    page = await self.context.new_page()
+                except Exception:
+                    self._created -= 1
+                    raise
+                self._opened.append(page)
+                return page
+            page = await self._pages.get()
+            if page is None:
+                continue  # 닫힌 페이지가 버려져 생긴 빈 자리
+            if not page.is_closed():
+                return page
+            self._discard(page)
+
+    def release(self, page):
+        """페이지를 풀에 반환 (닫힌 페이지는 버리고 빈 자리만 알림)"""
+        if page.is_closed():
+            self._discard(page)
+            # 반환을 기다리는 쪽이 새 페이지를 열 수 있도록 깨움
+            self._pages.put_nowait(None)
+        else:
+            self._pages.put_nowait(page)
+
+    def _discard(self, page):
+        """닫힌(충돌한) 페이지를 풀에서 빼고 그만큼 새로 열 수 있게 함"""
+        if page in self._opened:
+            self._opened.remove(page)
+        self._created -= 1
+
+    def page(self):
+        """async with 구문에서 사용할 페이지"""
+        return _PageLease(self)
+
+    def _on_persistent_close(self, context):
+        self._persistent_closed = True
+
+    async def reset(self):
+        """이번 실행의 컨텍스트와 페이지만 닫고 브라우저는 다음 실행을 위해 유지
+
+        프로필 모드에서는 컨텍스트(캐시, 쿠키)를 그대로 두고 열었던 페이지와 요청 필터만 정리한다.
+        """
+        try:
+            if self.context is not None and self.is_healthy():
+                if self.context is self._persistent:
+                    for page in self._opened:
+                        await page.close()
+                    if self.resource_filter is not None:
+                        await self.resource_filter.uninstall(self.context)
+                else:
+                    await self.context.close()
+        finally:
+            self.context = None
+            self._pages = asyncio.Queue()
+            self._opened = []
+            self._created = 0
+        if self._launched() and self.idle_timeout:
+            self._idle_handle = asyncio.get_running_loop().call_later(
+                self.idle_timeout, lambda: asyncio.ensure_future(self._close_if_idle())
+            )
+
+    async def _close_if_idle(self):
+        self._idle_handle = None
+        if self.context is None and self._launched():
+            print("브라우저를 오래 사용하지 않아 종료합니다")
+            await self.close()
+
+    def _cancel_idle_timer(self):
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    async def close(self):
+        """브라우저 종료 (서비스에 연결한 경우 연결만 끊음)"""
+        self._cancel_idle_timer()
+        await self._shutdown()
+
+    async def _shutdown(self):
+        try:
+            if self._launched() and self.is_healthy():
+                if self._persistent is not None:
+                    await self._persistent.close()
+                else:
+                    await self.browser.close()
+        finally:
+            if self._playwright is not None:
+                await self._playwright.stop()
+            self.browser = None
+            self.context = None
+            self.connected = False
+            self._playwright = None
+            self._persistent = None
+            self._pages = asyncio.Queue()
+            self._opened = []
+            self._created = 0
+
+
+class _PageLease:
+    def __init__(self, pool):
+        self.pool = pool
+        self.page = None
+
+    async def __aenter__(self):
+        self.page = await self.pool.acquire()
+        return self.page
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.pool.release(self.page)
+        return False
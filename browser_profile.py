@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+브라우저 프로필 관리 모듈 (실행 간 디스크 캐시/쿠키 유지)
+
+    python browser_profile.py            # 프로필 크기 확인
+    python browser_profile.py --reset    # 프로필 삭제 (캐시, 쿠키 초기화)
+"""
+import argparse
+import os
+import shutil
+
+
+DEFAULT_PROFILE_DIR = '.hanmi_browser_profile'
+
+# Chromium 디스크 캐시 최대 크기 (기본 100MB)
+DEFAULT_PROFILE_CACHE_BYTES = 100 * 1024 * 1024
+
+
+class BrowserProfile:
+    """실행이 끝나도 유지되는 Chromium 사용자 데이터 폴더
+
+    공통 JS 등 정적 파일과 쿠키가 Chromium 자체 캐시에 남아 있으므로
+    브라우저로 렌더링할 때 다시 내려받는 양이 줄어든다.
+    디스크 캐시는 cache_bytes까지만 쓰도록 Chromium에 지정한다.
+    """
+
+    def __init__(self, directory=DEFAULT_PROFILE_DIR, cache_bytes=DEFAULT_PROFILE_CACHE_BYTES):
+        self.directory = os.path.abspath(directory)
+        self.cache_bytes = int(cache_bytes)
+
+    def launch_args(self):
+        """프로필 브라우저 실행 옵션"""
+        return [f'--disk-cache-size={self.cache_bytes}']
+
+    def size(self):
+        """프로필 폴더 전체 크기(바이트)"""
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        return total
+
+    def reset(self):
+        """프로필 삭제 (브라우저가 이 프로필을 사용 중이 아닐 때 호출)"""
+        if os.path.isdir(self.directory):
+            shutil.rmtree(self.directory)
+            return True
+        return False
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="크롤러 브라우저 프로필 관리")
+    arg_parser.add_argument('--dir', default=DEFAULT_PROFILE_DIR, help="프로필 폴더")
+    arg_parser.add_argument('--reset', action='store_true', help="프로필 삭제 (캐시, 쿠키 초기화)")
+    args = arg_parser.parse_args()
+
+    profile = BrowserProfile(args.dir)
+    if args.reset:
+        if profile.reset():
+            print(f"✓ 브라우저 프로필 삭제: {profile.directory}")
+        else:
+            print(f"브라우저 프로필이 없습니다: {profile.directory}")
+        return
+    print(f"브라우저 프로필: {profile.directory} ({profile.size() / 1024 / 1024:.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+브라우저 서비스: Chromium을 계속 켜 두고 크롤러가 연결해서 사용
+
+크롤러를 실행할 때마다 브라우저를 새로 띄우지 않도록, 한 번 실행한
+브라우저를 CDP 엔드포인트로 공유한다. 연결된 크롤러가 없는 상태가
+--idle-timeout 초 동안 이어지면 스스로 종료한다.
+
+    python browser_service.py --port 9222 --idle-timeout 600
+
+    crawler = HanmiCrawler()
+    await crawler.run(browser_endpoint='http://127.0.0.1:9222')
+"""
+import argparse
+import asyncio
+import json
+import time
+import urllib.request
+
+from playwright.async_api import async_playwright
+
+from browser_pool import BROWSER_NOT_INSTALLED_MESSAGE, endpoint_alive
+
+
+DEFAULT_SERVICE_PORT = 9222
+
+# 상태 확인 간격(초)
+HEALTH_CHECK_INTERVAL = 5
+
+
+def _open_pages(endpoint):
+    """브라우저에 열려 있는 페이지(탭) 수 (응답이 없으면 0)"""
+    try:
+        with urllib.request.urlopen(endpoint + '/json/list', timeout=2) as response:
+            targets = json.loads(response.read().decode('utf-8'))
+    except Exception:
+        return 0
+    return sum(1 for target in targets if target.get('type') == 'page')
+
+
+async def serve(port=DEFAULT_SERVICE_PORT, idle_timeout=600, headless=True):
+    """브라우저를 실행하고 종료될 때까지 상태 확인"""
+    endpoint = f"http://127.0.0.1:{port}"
+    if await asyncio.to_thread(endpoint_alive, endpoint):
+        print(f"✗ 이미 {endpoint}에서 브라우저 서비스가 실행 중입니다.")
+        return
+
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(
+                headless=headless,
+                args=[f'--remote-debugging-port={port}', '--remote-debugging-address=127.0.0.1']
+            )
+        except Exception as e:
+            if "Executable doesn't exist" in str(e):
+                raise Exception(BROWSER_NOT_INSTALLED_MESSAGE)
+            raise
+
+        print(f"✓ 브라우저 서비스 시작: {endpoint}")
+        idle_since = time.monotonic()
+        try:
+            while browser.is_connected():
+                await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+                if not await asyncio.to_thread(endpoint_alive, endpoint):
+                    print("✗ 브라우저가 응답하지 않아 서비스를 종료합니다.")
+                    break
+
+                if await asyncio.to_thread(_open_pages, endpoint):
+                    idle_since = time.monotonic()
+                elif idle_timeout and time.monotonic() - idle_since >= idle_timeout:
+                    print(f"{idle_timeout}초 동안 사용되지 않아 서비스를 종료합니다.")
+                    break
+        finally:
+            if browser.is_connected():
+                await browser.close()
+        print("브라우저 서비스 종료")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="크롤러가 함께 쓰는 브라우저 서비스")
+    arg_parser.add_argument('--port', type=int, default=DEFAULT_SERVICE_PORT, help="CDP 포트")
+    arg_parser.add_argument('--idle-timeout', type=int, default=600,
+                            help="사용되지 않으면 종료할 시간(초), 0이면 계속 실행")
+    arg_parser.add_argument('--headed', action='store_true', help="브라우저 창 표시")
+    args = arg_parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.port, args.idle_timeout, headless=not args.headed))
+    except KeyboardInterrupt:
+        print("\n브라우저 서비스 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+크롤링 취소 신호 모듈
+"""
+import asyncio
+import threading
+
+
+class CancelToken:
+    """실행 중인 크롤링을 멈추기 위한 취소 신호
+
+    HanmiCrawler.run(cancel_token=token)으로 넘기면 run이 자신의 작업을 등록하고,
+    다른 스레드(GUI 등)에서 token.cancel()을 호출하면 그 작업이 바로 취소된다.
+    진행 중인 요청과 대기 중인 기사 수집은 중단되고, 그때까지 수집한 기사는 저장된다.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._tasks = []
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        """취소 요청 (어느 스레드에서든 호출 가능)"""
+        with self._lock:
+            self._event.set()
+            tasks = list(self._tasks)
+        for loop, task in tasks:
+            loop.call_soon_threadsafe(self._cancel_attached, task)
+
+    def _cancel_attached(self, task):
+        """이벤트 루프 스레드에서 실행: 그 사이 해제된 작업은 취소하지 않음"""
+        with self._lock:
+            attached = any(t is task for _, t in self._tasks)
+        if attached:
+            task.cancel()
+
+    def attach(self, task=None):
+        """취소 시 함께 취소할 작업 등록 (기본값: 현재 작업)"""
+        task = task if task else asyncio.current_task()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._tasks.append((loop, task))
+            cancelled = self._event.is_set()
+        if cancelled:
+            task.cancel()
+
+    def detach(self, task=None):
+        """등록한 작업 해제 (이후의 취소 요청은 이 작업에 전달되지 않음)"""
+        task = task if task else asyncio.current_task()
+        with self._lock:
+            self._tasks = [(loop, t) for loop, t in self._tasks if t is not task]
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 캐시 재검증 점검 (실제 aiohttp 응답 경로 사용)
+
+로컬 테스트 서버가 표준 표기(ETag, Last-Modified)로 검증 헤더를 보내고,
+크롤러가 페이지를 캐시에 저장한 뒤 유효 시간이 지난 항목을 조건부 요청
+(If-None-Match)으로 재검증해 304를 받는지 확인한다.
+실패하면 종료 코드 1을 반환한다.
+
+    python check_http_cache.py
+"""
+import asyncio
+import sys
+import tempfile
+
+ETAG = '"abc"'
+LAST_MODIFIED = 'Sun, 01 Feb 2026 05:14:16 GMT'
+ARTICLE_HTML = (
+    '<html><head><meta property="og:title" content="점검 기사"></head><body>'
+    '<ul class="info-text"><li>김 기자</li><li>등록 2026-02-01 14:14:16</li></ul>'
+    '<div class="fr-view"><p>본문</p></div></body></html>'
+)
+
+
+async def check():
+    """(확인 항목, 통과 여부) 목록 반환"""
+    from aiohttp import web
+    from fetch_cache import FetchCache, cache_key
+    from hanmi_crawler import HanmiCrawler
+    from http_fetcher import HttpFetcher
+
+    conditional = []
+
+    async def view(request):
+        conditional.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == ETAG:
+            return web.Response(status=304, headers={'ETag': ETAG})
+        return web.Response(text=ARTICLE_HTML, content_type='text/html',
+                            headers={'ETag': ETAG, 'Last-Modified': LAST_MODIFIED})
+
+    app = web.Application()
+    app.router.add_get('/news/view.php', view)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    url = f"http://127.0.0.1:{port}/news/view.php?idx=1"
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 기사 유효 시간 0: 두 번째 요청은 항상 재검증
+        cache = FetchCache(directory, ttl={'article': 0})
+        crawler = HanmiCrawler()
+        crawler.fetch_mode = 'http'
+        crawler.fetch_cache = cache
+        crawler.http_fetcher = HttpFetcher(max_connections=1)
+        await crawler.http_fetcher.start()
+        try:
+            first = await crawler._fetch_document(url, 'article')
+            entry = cache.get(cache_key(url, 'article'))
+            second = await crawler._fetch_document(url, 'article')
+        finally:
+            await crawler.http_fetcher.close()
+            cache.close()
+            await runner.cleanup()
+
+    return [
+        ("첫 요청 추출", first['title'] == '점검 기사'),
+        ("ETag 저장", entry is not None and entry['etag'] == ETAG),
+        ("Last-Modified 저장", entry is not None and entry['last_modified'] == LAST_MODIFIED),
+        ("If-None-Match 전송", conditional[1:] == [ETAG]),
+        ("304 재검증", cache.stats['revalidated'] == 1 and second['title'] == '점검 기사'),
+    ]
+
+
+def main():
+    results = asyncio.run(check())
+    for name, ok in results:
+        print(f"{'✓' if ok else '✗'} {name}")
+    if not all(ok for _, ok in results):
+        print("\n✗ HTTP 캐시 재검증이 동작하지 않습니다.")
+        sys.exit(1)
+    print("\n✓ HTTP 캐시 재검증이 동작합니다.")
+
+
+if __name__ == "__main__":
+    main()
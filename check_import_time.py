@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+프로그램 시작 시 모듈 불러오기 시간 점검
+
+GUI 창이 바로 뜨도록 시작할 때 무거운 패키지(playwright, bs4, openpyxl 등)를
+불러오지 않는지, 전체 불러오기 시간이 예산 안에 있는지 확인한다.
+예산을 넘거나 무거운 패키지가 불러와지면 종료 코드 1을 반환한다.
+
+    python check_import_time.py
+    python check_import_time.py --module hanmi_crawler --budget 150 --repeat 5
+"""
+import argparse
+import subprocess
+import sys
+
+
+# 시작 시 불러오면 안 되는 패키지 (해당 단계가 실행될 때만 불러옴)
+HEAVY_MODULES = (
+    'playwright', 'bs4', 'lxml', 'selectolax', 'openpyxl', 'pandas',
+    'numpy', 'aiohttp', 'pyarrow',
+)
+
+# 기본 예산(ms): GUI 모듈 전체 불러오기 시간
+DEFAULT_BUDGET_MS = 200
+
+
+def measure(module):
+    """새 인터프리터에서 module을 불러오고 [(모듈 이름, 누적 시간 us)] 반환"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise Exception(f"{module} 불러오기 실패:\n{result.stderr.strip().splitlines()[-1]}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings.append((name.strip(), int(cumulative)))
+    return timings
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="시작 시 모듈 불러오기 시간 점검")
+    arg_parser.add_argument('--module', default='crawler_ui', help="점검할 시작 모듈")
+    arg_parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS, help="허용 시간(ms)")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="측정 횟수 (가장 빠른 값 사용)")
+    arg_parser.add_argument('--top', type=int, default=10, help="오래 걸린 모듈 표시 개수")
+    args = arg_parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(max(1, args.repeat))]
+    timings = min(runs, key=lambda run: dict(run).get(args.module, 0))
+    total_ms = dict(timings).get(args.module, 0) / 1000
+
+    print(f"{args.module} 불러오기: {total_ms:.1f}ms (예산 {args.budget:.0f}ms)")
+    print("\n오래 걸린 최상위 모듈:")
+    top_level = [(name, us) for name, us in timings if name != args.module and '.' not in name]
+    for name, us in sorted(top_level, key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<30} {us / 1000:>8.1f}ms")
+
+    loaded = sorted({name.split('.')[0] for name, _ in timings} & set(HEAVY_MODULES))
+    ok = True
+    if loaded:
+        print(f"\n✗ 시작 시 무거운 패키지를 불러옵니다: {', '.join(loaded)}")
+        ok = False
+    if total_ms > args.budget:
+        print(f"\n✗ 불러오기 시간이 예산을 넘었습니다: {total_ms:.1f}ms > {args.budget:.0f}ms")
+        ok = False
+    if not ok:
+        sys.exit(1)
+    print("\n✓ 불러오기 시간이 예산 안에 있습니다.")
+
+
+if __name__ == "__main__":
+    main()
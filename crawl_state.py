@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+수집 이력 저장 모듈 (증분 크롤링용)
+"""
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+
+from url_frontier import article_idx
+
+
+DEFAULT_STATE_PATH = 'hanmi_crawl_state.sqlite'
+
+
+def content_hash(article):
+    """기사 제목과 본문의 해시 (내용 변경 확인용)"""
+    text = f"{article.get('title') or ''}\n{article.get('content') or ''}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class CrawlState:
+    """이전 실행에서 수집한 기사를 idx 기준으로 기록하는 SQLite 저장소
+
+    매시간 실행해도 새로 올라온 기사만 가져오도록 수집 여부를 확인하고,
+    필요하면 이전에 수집한 기사 데이터를 다시 꺼낼 수 있다.
+    """
+
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " idx TEXT PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " target_date TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " first_crawled_at TEXT NOT NULL,"
+            " last_crawled_at TEXT NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS articles_date ON articles (target_date)")
+        self.db.commit()
+
+    def is_seen(self, url):
+        """이미 수집한 기사인지 확인"""
+        row = self.db.execute(
+            "SELECT 1 FROM articles WHERE idx = ?", (article_idx(url),)
+        ).fetchone()
+        return row is not None
+
+    def record(self, article, target_date):
+        """수집한 기사 기록, 'new' / 'changed' / 'unchanged' 반환"""
+        idx = article_idx(article['url'])
+        new_hash = content_hash(article)
+        now = datetime.now().isoformat()
+        data = json.dumps(article, ensure_ascii=False)
+
+        row = self.db.execute("SELECT content_hash FROM articles WHERE idx = ?", (idx,)).fetchone()
+        if row is None:
+            self.db.execute(
+                "INSERT INTO articles"
+                " (idx, url, target_date, content_hash, first_crawled_at, last_crawled_at, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (idx, article['url'], target_date.isoformat(), new_hash, now, now, data)
+            )
+            status = 'new'
+        else:
+            self.db.execute(
+                "UPDATE articles SET url = ?, content_hash = ?, last_crawled_at = ?, data = ? WHERE idx = ?",
+                (article['url'], new_hash, now, data, idx)
+            )
+            status = 'unchanged' if row[0] == new_hash else 'changed'
+        self.db.commit()
+        return status
+
+    def articles_for(self, target_date):
+        """해당 날짜에 수집했던 기사 목록 (처음 수집한 순서)"""
+        rows = self.db.execute(
+            "SELECT data FROM articles WHERE target_date = ? ORDER BY first_crawled_at",
+            (target_date.isoformat(),)
+        ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def close(self):
+        self.db.close()
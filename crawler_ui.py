@@ -7,6 +7,7 @@ from tkinter import ttk, scrolledtext, messagebox
 from datetime import date, datetime
 import threading
 import asyncio
+import queue
 import sys
 import platform
 import os
@@ -22,6 +23,42 @@ if platform.system() == "Windows":
         pass  # PyInstaller 환경에서는 무시
 
 from hanmi_crawler import HanmiCrawler
+from browser_pool import BrowserPool
+from cancellation import CancelToken
+
+# 마지막 실행 후 브라우저를 켜 둘 시간(초)
+BROWSER_IDLE_TIMEOUT = 600
+
+# 이벤트 큐를 비우는 간격(ms)과 한 번에 처리할 최대 이벤트 수
+EVENT_POLL_MS = 100
+EVENT_BATCH_SIZE = 500
+
+
+class _QueueWriter:
+    """print 출력을 줄 단위로 이벤트 큐에 넣는 stdout 대체 객체 (스레드 안전)
+    
+    작업 스레드, 파싱 스레드 등 여러 스레드가 동시에 print해도 줄이 섞이거나
+    빠지지 않도록 버퍼는 잠금 안에서만 다룬다.
+    """
+    
+    def __init__(self, events):
+        self.events = events
+        self._buffer = ''
+        self._lock = threading.Lock()
+    
+    def write(self, text):
+        with self._lock:
+            self._buffer += text
+            while '\n' in self._buffer:
+                line, self._buffer = self._buffer.split('\n', 1)
+                self.events.put(('log', line))
+        return len(text)
+    
+    def flush(self):
+        with self._lock:
+            if self._buffer:
+                self.events.put(('log', self._buffer))
+                self._buffer = ''
 
 
 class CrawlerUI:
@@ -31,13 +68,27 @@ class CrawlerUI:
         self.root.geometry("800x750")
         self.root.resizable(False, False)
         
-        # 크롤링 중 플래그
+        # 크롤링 중 플래그와 중지 신호
         self.is_crawling = False
+        self.cancel_token = None
+        
+        # 실행마다 브라우저를 새로 띄우지 않도록 이벤트 루프와 브라우저 풀을 계속 유지
+        self.loop = None
+        self.browser_pool = None
+        
+        # 작업 스레드 → GUI 전달용 이벤트 큐 (로그, 진행 이벤트, 완료/오류)
+        self.events = queue.Queue()
+        self.progress_total = 0
+        self.progress_done = 0
+        self.progress_failed = 0
+        self.progress_started = None
+        self.progress_last = None
         
         # 플랫폼별 폰트 설정
         self.font_family = self._get_platform_font()
         
         self._create_widgets()
+        self.root.after(EVENT_POLL_MS, self._drain_events)
     
     def _get_platform_font(self):
         """플랫폼에 맞는 폰트 반환"""
@@ -100,6 +151,48 @@ class CrawlerUI:
         )
         max_articles_spinbox.grid(row=1, column=1, sticky=tk.W, pady=(10, 0))
         
+        # 동시 수집 수
+        ttk.Label(date_frame, text="동시 수집 수:").grid(row=2, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        
+        self.concurrency_var = tk.StringVar(value="3")
+        concurrency_spinbox = ttk.Spinbox(
+            date_frame,
+            from_=1,
+            to=8,
+            textvariable=self.concurrency_var,
+            width=10
+        )
+        concurrency_spinbox.grid(row=2, column=1, sticky=tk.W, pady=(10, 0))
+        
+        # 수집 방식 (HTTP 우선 시 브라우저는 필요한 페이지에만 사용)
+        self.http_mode_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            date_frame,
+            text="빠른 수집 (HTTP 우선, 필요 시 브라우저 사용)",
+            variable=self.http_mode_var
+        ).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        # 페이지 캐시 (같은 날짜 재실행 시 변경되지 않은 페이지는 다시 받지 않음)
+        self.use_cache_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            date_frame,
+            text="페이지 캐시 사용 (재실행 시 빠름)",
+            variable=self.use_cache_var
+        ).grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        
+        # 증분 수집 (이전 실행에서 수집한 기사 제외)
+        self.incremental_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            date_frame,
+            text="새 기사만 수집 (이전 실행에서 수집한 기사 제외)",
+            variable=self.incremental_var
+        ).grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        
+        # 분류 코드 (쉼표로 구분, 여러 분류를 동시에 탐색)
+        ttk.Label(date_frame, text="분류 코드:").grid(row=6, column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0))
+        self.categories_var = tk.StringVar(value="m93atmw")
+        ttk.Entry(date_frame, textvariable=self.categories_var, width=30).grid(row=6, column=1, sticky=tk.W, pady=(10, 0))
+        
         # 이메일 설정 프레임
         email_frame = ttk.LabelFrame(main_frame, text="이메일 설정", padding="10")
         email_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
@@ -178,11 +271,19 @@ class CrawlerUI:
         progress_frame = ttk.LabelFrame(main_frame, text="진행 상황", padding="10")
         progress_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
+        # 진행률 표시줄과 수집 속도
+        progress_bar_frame = ttk.Frame(progress_frame)
+        progress_bar_frame.pack(fill=tk.X, pady=(0, 5))
+        self.progress_bar = ttk.Progressbar(progress_bar_frame, mode='determinate', maximum=1)
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.rate_label = ttk.Label(progress_bar_frame, text="", width=28, font=(self.font_family, 9))
+        self.rate_label.pack(side=tk.LEFT, padx=(10, 0))
+        
         # 로그 텍스트 영역
         self.log_text = scrolledtext.ScrolledText(
             progress_frame,
             width=80,
-            height=15,
+            height=13,
             wrap=tk.WORD,
             font=(self.font_family, 9)
         )
@@ -212,10 +313,84 @@ class CrawlerUI:
             self.recipient_email_entry.config(state=tk.DISABLED)
     
     def log(self, message):
-        """로그 메시지 추가"""
+        """로그 메시지 추가 (GUI 스레드에서만 호출, 작업 스레드는 self.events 사용)"""
         self.log_text.insert(tk.END, f"{message}\n")
         self.log_text.see(tk.END)
-        self.root.update()
+    
+    def _post(self, kind, payload=None):
+        """작업 스레드에서 GUI로 이벤트 전달"""
+        self.events.put((kind, payload))
+    
+    def _on_progress(self, event):
+        """크롤러 진행 이벤트 (크롤러 스레드에서 호출됨)"""
+        self.events.put(('progress', event))
+    
+    def _drain_events(self):
+        """이벤트 큐를 모아서 처리 (Tk after 루프, GUI 스레드)"""
+        lines = []
+        progressed = False
+        try:
+            for _ in range(EVENT_BATCH_SIZE):
+                kind, payload = self.events.get_nowait()
+                if kind == 'log':
+                    lines.append(payload)
+                    continue
+                
+                # 완료/오류 처리 전에 쌓인 로그를 먼저 출력
+                if lines:
+                    self.log('\n'.join(lines))
+                    lines = []
+                if kind == 'progress':
+                    self._apply_progress(payload)
+                    progressed = True
+                elif kind == 'finished':
+                    self._on_finished(payload)
+                elif kind == 'error':
+                    self._on_error(payload)
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self.log('\n'.join(lines))
+        if progressed:
+            self._update_progress_display()
+        self.root.after(EVENT_POLL_MS, self._drain_events)
+    
+    def _apply_progress(self, event):
+        self.progress_last = event['time']
+        if event['event'] in ('found', 'discovered'):
+            # 목록 탐색과 수집이 동시에 진행되므로 전체 수는 탐색하면서 늘어남
+            self.progress_total = event['total']
+            if self.progress_started is None:
+                self.progress_started = event['time']
+        elif event['event'] == 'fetched':
+            self.progress_done += 1
+        elif event['event'] == 'failed':
+            self.progress_done += 1
+            self.progress_failed += 1
+    
+    def _update_progress_display(self):
+        """진행률 표시줄과 수집 속도 갱신"""
+        self.progress_bar.config(maximum=max(1, self.progress_total), value=self.progress_done)
+        text = f"{self.progress_done}/{self.progress_total}"
+        if self.progress_failed:
+            text += f" (실패 {self.progress_failed})"
+        if self.progress_started is not None and self.progress_done:
+            # 이벤트 발생 시각 기준 (큐 처리 지연과 무관)
+            elapsed = self.progress_last - self.progress_started
+            if elapsed > 0:
+                text += f" · {self.progress_done / elapsed:.1f}건/초"
+        self.rate_label.config(text=text)
+        self.status_label.config(text=f"크롤링 중... {self.progress_done}/{self.progress_total}")
+    
+    def _reset_progress(self):
+        self.progress_total = 0
+        self.progress_done = 0
+        self.progress_failed = 0
+        self.progress_started = None
+        self.progress_last = None
+        self.progress_bar.config(maximum=1, value=0)
+        self.rate_label.config(text="")
     
     def start_crawling(self):
         """크롤링 시작"""
@@ -238,10 +413,12 @@ class CrawlerUI:
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.is_crawling = True
+        self.cancel_token = CancelToken()
         
         # 로그 초기화
         self.log_text.delete(1.0, tk.END)
         self.status_label.config(text="크롤링 중...")
+        self._reset_progress()
         
         # 날짜 설정
         if self.date_var.get() == "오늘":
@@ -256,6 +433,22 @@ class CrawlerUI:
         except:
             max_articles = 10
         
+        # 동시 수집 수
+        try:
+            concurrency = int(self.concurrency_var.get())
+        except:
+            concurrency = 1
+        
+        # 수집 방식
+        fetch_mode = 'http' if self.http_mode_var.get() else 'browser'
+        use_cache = self.use_cache_var.get()
+        incremental = self.incremental_var.get()
+        
+        # 분류 코드
+        categories = [code.strip() for code in self.categories_var.get().split(',') if code.strip()]
+        if not categories:
+            categories = ['m93atmw']
+        
         # 이메일 설정
         email_config = None
         if self.send_email_var.get():
@@ -270,79 +463,133 @@ class CrawlerUI:
         # 별도 스레드에서 크롤링 실행
         thread = threading.Thread(
             target=self.run_crawler,
-            args=(target_date, max_articles, email_config),
+            args=(target_date, max_articles, email_config, concurrency, fetch_mode, use_cache, incremental,
+                  categories),
             daemon=True
         )
         thread.start()
     
-    def run_crawler(self, target_date, max_articles, email_config=None):
-        """크롤러 실행 (별도 스레드)"""
+    def _ensure_loop(self):
+        """크롤러용 이벤트 루프 스레드 시작 (이미 있으면 재사용)"""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(target=self.loop.run_forever, daemon=True).start()
+            self.browser_pool = BrowserPool(idle_timeout=BROWSER_IDLE_TIMEOUT)
+        return self.loop
+    
+    def close(self):
+        """창 닫기 (켜 둔 브라우저 종료)"""
+        if self.loop is not None and not self.is_crawling:
+            try:
+                asyncio.run_coroutine_threadsafe(self.browser_pool.close(), self.loop).result(timeout=10)
+            except Exception:
+                pass
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.root.destroy()
+    
+    def run_crawler(self, target_date, max_articles, email_config=None, concurrency=1, fetch_mode='browser',
+                    use_cache=False, incremental=False, categories=('m93atmw',)):
+        """크롤러 실행 (별도 스레드, GUI는 self.events 큐를 통해서만 갱신)"""
+        # 크롤러의 print를 줄 단위로 바로 로그에 전달
+        old_stdout = sys.stdout
+        sys.stdout = _QueueWriter(self.events)
         try:
-            # 새로운 이벤트 루프 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # 브라우저를 켜 둔 이벤트 루프에서 실행 (두 번째 실행부터는 브라우저 시작 시간 없음)
+            loop = self._ensure_loop()
             
-            self.log(f"크롤링 시작: {target_date.strftime('%Y-%m-%d')}")
-            self.log(f"최대 기사 수: {max_articles}개")
+            self._post('log', f"크롤링 시작: {target_date.strftime('%Y-%m-%d')}")
+            self._post('log', f"최대 기사 수: {max_articles}개")
+            self._post('log', f"동시 수집 수: 최대 {concurrency}개 (요청 속도 자동 조절)")
+            self._post('log', f"수집 방식: {'HTTP 우선' if fetch_mode == 'http' else '브라우저'}")
+            self._post('log', f"분류: {', '.join(categories)}")
+            if incremental:
+                self._post('log', "새 기사만 수집")
             if email_config:
-                self.log(f"이메일 전송: {email_config['recipient_email']}\n")
+                self._post('log', f"이메일 전송: {email_config['recipient_email']}\n")
             else:
-                self.log("파일 저장 모드\n")
+                self._post('log', "파일 저장 모드\n")
             
             # 크롤러 실행
             crawler = HanmiCrawler(target_date=target_date)
             
-            # 크롤러의 print를 로그로 리다이렉트
-            import sys
-            from io import StringIO
+            asyncio.run_coroutine_threadsafe(crawler.run(
+                max_articles=max_articles,
+                use_list_page=True,
+                email_config=email_config,
+                concurrency=concurrency,
+                adaptive_rate=True,
+                fetch_mode=fetch_mode,
+                use_cache=use_cache,
+                incremental=incremental,
+                categories=categories,
+                browser_pool=self.browser_pool,
+                progress=self._on_progress,
+                cancel_token=self.cancel_token
+            ), loop).result()
             
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            
-            loop.run_until_complete(crawler.run(max_articles=max_articles, use_list_page=True, email_config=email_config))
-            
-            # 출력 내용 가져오기
-            output = sys.stdout.getvalue()
-            sys.stdout = old_stdout
-            
-            # 로그에 출력
-            for line in output.split('\n'):
-                if line.strip():
-                    self.log(line)
-            
-            self.log("\n✅ 크롤링 완료!")
-            self.status_label.config(text="완료!")
-            
-            if email_config:
-                messagebox.showinfo(
-                    "완료",
-                    f"크롤링이 완료되었습니다!\n수집된 기사: {len(crawler.articles)}개\n이메일 전송: {email_config['recipient_email']}"
-                )
-            else:
-                messagebox.showinfo(
-                    "완료",
-                    f"크롤링이 완료되었습니다!\n수집된 기사: {len(crawler.articles)}개"
-                )
+            sys.stdout.flush()
+            self._post('finished', {
+                'count': len(crawler.articles),
+                'email_config': email_config,
+                'cancelled': crawler.cancelled,
+                'partial': crawler.partial
+            })
             
         except Exception as e:
-            self.log(f"\n❌ 오류 발생: {str(e)}")
-            self.status_label.config(text="오류 발생")
-            messagebox.showerror("오류", f"크롤링 중 오류가 발생했습니다:\n{str(e)}")
+            sys.stdout.flush()
+            self._post('error', str(e))
         
         finally:
-            # 버튼 상태 복원
-            self.start_button.config(state=tk.NORMAL)
-            self.stop_button.config(state=tk.DISABLED)
-            self.is_crawling = False
-            loop.close()
+            sys.stdout = old_stdout
+    
+    def _on_finished(self, result):
+        """크롤링 완료 처리 (GUI 스레드)"""
+        self._restore_buttons()
+        if result['cancelled']:
+            self.log("\n⏹ 크롤링 중지됨")
+            self.status_label.config(text="중지됨")
+            messagebox.showinfo("중지", f"크롤링을 중지했습니다.\n저장된 기사: {result['count']}개")
+            return
+        
+        self.log("\n✅ 크롤링 완료!")
+        self.status_label.config(text="완료!")
+        
+        # 목록 탐색이 일부 실패한 경우
+        note = "\n(목록 탐색 일부 실패: 찾은 기사만 수집)" if result['partial'] else ""
+        
+        email_config = result['email_config']
+        if email_config:
+            messagebox.showinfo(
+                "완료",
+                f"크롤링이 완료되었습니다!\n수집된 기사: {result['count']}개\n이메일 전송: {email_config['recipient_email']}{note}"
+            )
+        else:
+            messagebox.showinfo(
+                "완료",
+                f"크롤링이 완료되었습니다!\n수집된 기사: {result['count']}개{note}"
+            )
+    
+    def _on_error(self, message):
+        """크롤링 오류 처리 (GUI 스레드)"""
+        self.log(f"\n❌ 오류 발생: {message}")
+        self.status_label.config(text="오류 발생")
+        self._restore_buttons()
+        messagebox.showerror("오류", f"크롤링 중 오류가 발생했습니다:\n{message}")
+    
+    def _restore_buttons(self):
+        """버튼 상태 복원"""
+        self.start_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        self.is_crawling = False
     
     def stop_crawling(self):
         """크롤링 중지"""
-        if self.is_crawling:
-            self.log("\n⚠️ 크롤링 중지 요청...")
+        if self.is_crawling and self.cancel_token is not None and not self.cancel_token.cancelled:
+            self.log("\n⚠️ 크롤링 중지 요청... (지금까지 수집한 기사는 저장됩니다)")
             self.status_label.config(text="중지 중...")
-            # 실제 중지는 구현하지 않음 (복잡도 증가)
-            messagebox.showinfo("알림", "현재 진행 중인 작업이 완료될 때까지 기다려주세요.")
+            self.stop_button.config(state=tk.DISABLED)
+            # 진행 중인 요청과 대기 중인 수집을 바로 취소 (완료 처리는 _on_finished에서)
+            self.cancel_token.cancel()
 
 
 def main():
@@ -352,6 +599,7 @@ def main():
     
     root = tk.Tk()
     app = CrawlerUI(root)
+    root.protocol("WM_DELETE_WINDOW", app.close)
     root.mainloop()
 
 
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+기사 목록 엑셀 저장 모듈 (행 단위 스트리밍 쓰기)
+"""
+import os
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Alignment, Font, NamedStyle
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.fonts import DEFAULT_FONT
+
+
+# (기사 필드, 열 이름, 열 너비)
+EXCEL_COLUMNS = (
+    ('title', '제목', 50),
+    ('author', '저자', 25),
+    ('date', '등록일시', 20),
+    ('content', '본문', 120),
+    ('url', 'URL', 60),
+    ('crawled_at', '크롤링일시', 20),
+)
+
+SHEET_TITLE = '기사목록'
+
+# 엑셀 한도: 시트당 1,048,576행(헤더 제외), 셀당 32,767자
+EXCEL_MAX_DATA_ROWS = 1048576 - 1
+EXCEL_MAX_CELL_CHARS = 32767
+
+HEADER_STYLE = NamedStyle(
+    name='hanmi_header',
+    font=Font(bold=True, size=11),
+    border=DEFAULT_BORDER,
+    alignment=Alignment(horizontal='center', vertical='center')
+)
+BODY_STYLE = NamedStyle(
+    name='hanmi_body',
+    font=DEFAULT_FONT,
+    border=DEFAULT_BORDER,
+    alignment=Alignment(wrap_text=True, vertical='top', horizontal='left')
+)
+
+
+def _cell_text(value):
+    """셀에 쓸 값 (엑셀에서 허용하지 않는 제어 문자 제거, 셀 한도까지 자름)"""
+    if value is None:
+        return None
+    text = ILLEGAL_CHARACTERS_RE.sub('', str(value))
+    return text[:EXCEL_MAX_CELL_CHARS]
+
+
+def _row_height(content):
+    """본문 길이에 따라 행 높이 계산 (본문이 없으면 None)"""
+    if not content:
+        return None
+    estimated_lines = max(3, len(str(content)) // 120)
+    return min(estimated_lines * 15, 400)
+
+
+class ExcelArticleWriter:
+    """기사를 한 행씩 바로 파일로 내보내는 엑셀 저장기
+
+    openpyxl 쓰기 전용 모드를 사용하므로 기사 수와 관계없이 메모리 사용량이 일정하다.
+    스타일은 이름 있는 스타일 두 개(헤더/본문)를 모든 셀이 공유하고, 열 너비는
+    시트를 만들 때 한 번만 지정한다. 시트의 행 수가 max_rows_per_sheet에 이르면
+    새 시트('기사목록 (2)' ...)로, 파일의 시트 수가 max_sheets_per_file에 이르면
+    새 파일('이름_2.xlsx' ...)로 이어서 쓴다.
+
+    with ExcelArticleWriter('articles.xlsx') as writer:
+        for article in articles:
+            writer.write(article)
+    print(writer.filenames)
+    """
+
+    def __init__(self, filename, max_rows_per_sheet=EXCEL_MAX_DATA_ROWS, max_sheets_per_file=None):
+        self.filename = filename
+        self.max_rows_per_sheet = max(1, min(int(max_rows_per_sheet), EXCEL_MAX_DATA_ROWS))
+        self.max_sheets_per_file = max_sheets_per_file
+        self.filenames = []
+        self.count = 0
+        self._workbook = None
+        self._sheet = None
+        self._sheet_count = 0
+        self._sheet_rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _new_workbook(self):
+        """다음 파일 시작 (첫 파일은 지정한 이름, 이후는 _2, _3 ...)"""
+        self._save_workbook()
+        if self.filenames:
+            base, ext = os.path.splitext(self.filename)
+            filename = f"{base}_{len(self.filenames) + 1}{ext}"
+        else:
+            filename = self.filename
+        self.filenames.append(filename)
+
+        self._workbook = Workbook(write_only=True)
+        self._workbook.add_named_style(HEADER_STYLE)
+        self._workbook.add_named_style(BODY_STYLE)
+        self._sheet_count = 0
+
+    def _new_sheet(self):
+        """다음 시트 시작 (열 너비, 헤더 행)"""
+        if (self._workbook is None
+                or (self.max_sheets_per_file and self._sheet_count >= self.max_sheets_per_file)):
+            self._new_workbook()
+
+        self._sheet_count += 1
+        title = SHEET_TITLE if self._sheet_count == 1 else f"{SHEET_TITLE} ({self._sheet_count})"
+        self._sheet = self._workbook.create_sheet(title)
+        self._sheet_rows = 0
+
+        # 쓰기 전용 시트는 열 설정을 첫 행보다 먼저 해야 함
+        for column, (_, _, width) in zip('ABCDEF', EXCEL_COLUMNS):
+            self._sheet.column_dimensions[column].width = width
+
+        header = []
+        for _, name, _ in EXCEL_COLUMNS:
+            cell = WriteOnlyCell(self._sheet, value=name)
+            cell.style = HEADER_STYLE.name
+            header.append(cell)
+        self._sheet.append(header)
+
+    def write(self, article):
+        """기사 한 건을 다음 행에 기록"""
+        if self._sheet is None or self._sheet_rows >= self.max_rows_per_sheet:
+            self._new_sheet()
+
+        row = []
+        for field, _, _ in EXCEL_COLUMNS:
+            cell = WriteOnlyCell(self._sheet, value=_cell_text(article.get(field)))
+            cell.style = BODY_STYLE.name
+            row.append(cell)
+
+        # 행 높이를 본문 길이에 따라 조정 (행을 쓰기 전에 지정)
+        height = _row_height(article.get('content'))
+        if height:
+            self._sheet.row_dimensions[self._sheet_rows + 2].height = height
+
+        self._sheet.append(row)
+        self._sheet_rows += 1
+        self.count += 1
+
+    def _save_workbook(self):
+        if self._workbook is not None:
+            self._workbook.save(self.filenames[-1])
+            self._workbook = None
+            self._sheet = None
+
+    def close(self):
+        """남은 내용 저장, 만든 파일 이름 목록 반환 (기사가 없어도 헤더만 있는 파일 생성)"""
+        if not self.filenames:
+            self._new_sheet()
+        self._save_workbook()
+        return self.filenames
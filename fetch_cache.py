@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+디스크 페이지 캐시 모듈 (TTL, 용량 제한 LRU, ETag/Last-Modified 재검증)
+"""
+import gzip
+import hashlib
+import os
+import sqlite3
+import time
+from collections import Counter
+
+from url_frontier import article_idx
+
+
+DEFAULT_CACHE_DIR = '.hanmi_cache'
+
+# 단계별 캐시 유효 시간(초): 목록은 새 기사가 계속 올라오므로 짧게
+DEFAULT_CACHE_TTL = {
+    'list': 300,
+    'main': 300,
+    'article': 24 * 60 * 60,
+}
+
+
+def cache_key(url, stage):
+    """캐시 키: 기사는 정규화 키(idx) 기준(article:<idx>), 그 외 페이지는 URL 기준"""
+    if stage == 'article':
+        return f"article:{article_idx(url)}"
+    return f"{stage}:{url}"
+
+
+class FetchCache:
+    """가져온 페이지 HTML을 디스크에 보관하는 캐시
+
+    본문은 내용 해시(sha256)로 objects/ 아래에 gzip으로 저장하고(같은 내용은 한 번만),
+    키별 메타데이터(ETag, Last-Modified, 시각)는 index.sqlite에 둔다.
+    유효 시간이 지난 항목은 조건부 요청으로 재검증하며, 전체 크기가
+    max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지운다.
+    캐시를 읽을 때마다 디스크에 쓰지 않도록 사용 시각은 메모리에 모아 두었다가
+    put()(정리 전)과 close() 때 한 번에 기록한다.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=200 * 1024 * 1024, ttl=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = dict(DEFAULT_CACHE_TTL)
+        self.ttl.update(ttl or {})
+        self.stats = Counter()
+        self._accessed = {}
+
+        self._objects_dir = os.path.join(directory, 'objects')
+        os.makedirs(self._objects_dir, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(directory, 'index.sqlite'))
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " fetched_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+        self.db.commit()
+
+    def _object_path(self, content_hash):
+        return os.path.join(self._objects_dir, content_hash[:2], content_hash + '.gz')
+
+    def get(self, key):
+        """캐시 항목 반환 (없거나 본문 파일이 사라졌으면 None)"""
+        row = self.db.execute(
+            "SELECT url, content_hash, etag, last_modified, fetched_at FROM entries WHERE key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        url, content_hash, etag, last_modified, fetched_at = row
+        try:
+            with gzip.open(self._object_path(content_hash), 'rt', encoding='utf-8') as f:
+                html = f.read()
+        except (OSError, EOFError):
+            self._delete(key)
+            return None
+
+        self._accessed[key] = time.time()
+        return {
+            'key': key,
+            'url': url,
+            'html': html,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at,
+        }
+
+    def is_fresh(self, entry, stage):
+        """유효 시간 안에 있는지 확인 (재검증 없이 사용 가능)"""
+        return time.time() - entry['fetched_at'] < self.ttl.get(stage, 0)
+
+    def conditional_headers(self, entry):
+        """재검증용 조건부 요청 헤더"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def refresh(self, key):
+        """304 응답으로 재검증된 항목의 유효 시간 갱신"""
+        now = time.time()
+        self._accessed.pop(key, None)
+        self.db.execute("UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+        self.db.commit()
+
+    def put(self, key, url, html, etag=None, last_modified=None):
+        """페이지 HTML 저장 후 필요하면 오래된 항목 정리"""
+        data = html.encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._object_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + '.tmp'
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        old = self.db.execute("SELECT content_hash FROM entries WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        self._accessed.pop(key, None)
+        self._write_accessed()
+        self.db.execute(
+            "INSERT OR REPLACE INTO entries"
+            " (key, url, content_hash, size, etag, last_modified, fetched_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, content_hash, os.path.getsize(path), etag, last_modified, now, now)
+        )
+        self.db.commit()
+        if old and old[0] != content_hash:
+            self._remove_unreferenced(old[0])
+        self._evict()
+
+    def _write_accessed(self):
+        """모아 둔 사용 시각 기록 (커밋은 호출한 쪽에서)"""
+        if self._accessed:
+            self.db.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+    def total_size(self):
+        """저장된 본문 파일의 전체 크기(바이트)"""
+        row = self.db.execute(
+            "SELECT SUM(size) FROM (SELECT MAX(size) AS size FROM entries GROUP BY content_hash)"
+        ).fetchone()
+        return row[0] or 0
+
+    def _evict(self):
+        """max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        total = self.total_size()
+        if total <= self.max_bytes:
+            return
+        rows = self.db.execute("SELECT key FROM entries ORDER BY accessed_at").fetchall()
+        for (key,) in rows:
+            if total <= self.max_bytes:
+                break
+            total -= self._delete(key)
+            self.stats['evicted'] += 1
+
+    def _delete(self, key):
+        """항목 삭제, 실제로 지운 본문 파일 크기 반환"""
+        row = self.db.execute("SELECT content_hash FROM entries WHERE key = ?", (key,)).fetchone()
+        self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self.db.commit()
+        if row:
+            return self._remove_unreferenced(row[0])
+        return 0
+
+    def _remove_unreferenced(self, content_hash):
+        """다른 키가 참조하지 않는 본문 파일 삭제, 지운 크기 반환"""
+        in_use = self.db.execute(
+            "SELECT 1 FROM entries WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        if in_use:
+            return 0
+        path = self._object_path(content_hash)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            return size
+        except OSError:
+            return 0
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        for (key,) in self.db.execute("SELECT key FROM entries").fetchall():
+            self._delete(key)
+
+    def summary(self):
+        """캐시 사용 현황 요약 문자열"""
+        return (
+            f"유효 {self.stats['fresh']}개, 재검증(변경 없음) {self.stats['revalidated']}개, "
+            f"새로 저장 {self.stats['stored']}개, 정리 {self.stats['evicted']}개"
+        )
+
+    def close(self):
+        self._write_accessed()
+        self.db.commit()
+        self.db.close()
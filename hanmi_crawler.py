@@ -4,14 +4,26 @@
 """
 import asyncio
 import json
-from datetime import datetime, date
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
 import re
-import pandas as pd
+import time
+from collections import Counter, deque
+from datetime import datetime, date, timedelta
 import sys
 import platform
 import os
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+from rate_limiter import HostRateLimiter, AdaptiveRateLimiter
+from browser_pool import BrowserPool
+from page_readiness import ReadinessPolicy
+from resource_filter import ResourceFilter
+from article_parser import get_parser
+from fetch_cache import FetchCache, cache_key
+from crawl_state import CrawlState
+from url_frontier import BloomFilter, UrlFrontier, canonical_url
+from article_sinks import AggregateSink
+from parse_pool import ParsePool, process_page
+from retry_policy import RetryPolicy, FetchError, classify_error
 
 # 윈도우 콘솔 UTF-8 인코딩 설정 (PyInstaller 호환)
 if platform.system() == "Windows":
@@ -23,16 +35,96 @@ if platform.system() == "Windows":
     except:
         pass  # PyInstaller 환경에서는 무시
 
-from openpyxl.styles import Alignment, Font
+
+# 기사 페이지 수집 방식
+FETCH_MODES = ('browser', 'http')
+
+# 기본 수집 분류 (목록 페이지 mcode)
+DEFAULT_CATEGORIES = ('m93atmw',)
+
+# 목록 페이지 번호 파라미터와 기본 최대 탐색 페이지 수
+LIST_PAGE_PARAM = 'page'
+DEFAULT_MAX_LIST_PAGES = 30
+
+# 목록의 등록일 형식 (YYYY-MM-DD)
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}$')
+
+
+def _uncancel_current_task():
+    """중지 요청을 처리한 뒤 현재 작업의 취소 상태 해제 (이후 정리 작업을 계속하기 위해)"""
+    task = asyncio.current_task()
+    if task is not None and hasattr(task, 'uncancel'):
+        task.uncancel()
+
+
+def _reached(count, max_articles):
+    """수집 개수 제한에 도달했는지 확인 (max_articles가 None이면 제한 없음)"""
+    return max_articles is not None and count >= max_articles
+
+
+async def _as_async_iter(items):
+    """일반 반복 객체와 비동기 반복 객체를 같은 방식으로 순회"""
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
 
 
 class HanmiCrawler:
-    def __init__(self, target_date=None):
+    def __init__(self, target_date=None, end_date=None):
         self.base_url = "https://www.hanmiilbo.kr"
         self.articles = []
         # 타겟 날짜 설정 (기본값: 오늘)
         self.target_date = target_date if target_date else date.today()
-        print(f"크롤링 대상 날짜: {self.target_date.strftime('%Y-%m-%d')}")
+        # 기간 수집: target_date ~ end_date (한 번의 목록 탐색으로 여러 날짜 수집)
+        self.start_date = self.target_date
+        self.end_date = end_date if end_date else self.target_date
+        if self.end_date < self.start_date:
+            raise ValueError("end_date는 target_date보다 빠를 수 없습니다.")
+        # 호스트별 요청 간격 제한, 브라우저 풀, HTTP 클라이언트 (run에서 설정)
+        self.concurrency = 1
+        self.progress = None
+        self.cancelled = False
+        self.partial = False
+        self.rate_limiter = HostRateLimiter()
+        self.retry_policy = RetryPolicy()
+        self.readiness = ReadinessPolicy()
+        self.parser = get_parser()
+        self.parse_pool = None
+        self.browser_pool = None
+        self.resource_filter = None
+        self.http_fetcher = None
+        self.fetch_mode = 'browser'
+        self.fetch_cache = None
+        self.crawl_state = None
+        self.article_archive = None
+        self.html_archive = None
+        self.skipped_seen = 0
+        self.article_categories = {}
+        self.article_dates = {}
+        self.incomplete_articles = set()
+        self.forget_fetched = False
+        self.discovered_count = 0
+        self.browser_fallbacks = 0
+        self.extraction_rules = Counter()
+        if self.is_range:
+            print(f"크롤링 대상 기간: {self.start_date.strftime('%Y-%m-%d')} ~ {self.end_date.strftime('%Y-%m-%d')}")
+        else:
+            print(f"크롤링 대상 날짜: {self.target_date.strftime('%Y-%m-%d')}")
+    
+    @property
+    def is_range(self):
+        """여러 날짜를 수집하는 기간 모드인지 여부"""
+        return self.end_date != self.start_date
+    
+    def _in_date_range(self, date_str):
+        """목록의 날짜 문자열(YYYY-MM-DD)이 수집 기간 안에 있는지 확인"""
+        return (
+            date_str is not None
+            and self.start_date.strftime('%Y-%m-%d') <= date_str <= self.end_date.strftime('%Y-%m-%d')
+        )
     
     def _get_browser_path(self):
         """Playwright 브라우저 경로 찾기 (PyInstaller 환경 지원)"""
@@ -68,118 +160,324 @@ class HanmiCrawler:
             print(f"브라우저 경로 확인 중 오류: {e}")
             return None
     
-    async def crawl_list_page(self, page, list_url, max_articles=10):
-        """카테고리 목록 페이지에서 기사 목록 수집 (날짜 필터링 포함)"""
-        print(f"\n목록 페이지 접속 중: {list_url}")
-        await page.goto(list_url, wait_until="networkidle")
-        await asyncio.sleep(2)
+    async def _goto(self, page, url, stage):
+        """호스트별 요청 간격을 지키면서 페이지 이동 (필요한 요소가 생기면 바로 반환)"""
+        async with self.rate_limiter.slot(url):
+            return await self.readiness.goto(page, url, stage)
+    
+    async def _process(self, html, stage):
+        """HTML 파싱과 추출, (필요한 요소가 있는지, 단계별 결과) 반환 (파싱 풀이 있으면 풀에서)"""
+        if self.parse_pool is not None:
+            return await self.parse_pool.process(html, stage)
+        return process_page(self.parser, html, stage)
+    
+    async def _fetch_document(self, url, stage):
+        """페이지 HTML을 가져와 파싱하고 단계별 결과 반환
         
-        content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
+        결과는 목록/메인 페이지는 항목 목록, 기사 페이지는 추출한 기사 정보이다.
+        캐시가 유효하면 네트워크 없이 캐시를 사용하고, 유효 시간이 지났으면
+        ETag/Last-Modified 조건부 요청으로 변경 여부만 확인한다. 캐시에는 추출에
+        필요한 요소가 있는 페이지만 저장하고, 요소가 없는 캐시 항목은 없는 것으로 본다.
+        HTTP 모드에서는 먼저 정적 HTML을 받아보고, 추출에 필요한 요소가
+        없을 때만 해당 페이지를 브라우저로 다시 연다. 브라우저로 연 기사 페이지가
+        load 이벤트도 오지 않은 채(덜 받아짐) 필요한 요소가 없으면 FetchError('parse')를
+        발생시키고(재시도 대상), 다 받아졌는데 요소가 없으면 추출한 결과를 그대로 반환한다.
+        """
+        cache = self.fetch_cache
+        key = cache_key(url, stage)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None and cache.is_fresh(cached, stage):
+            has_markup, result = await self._process(cached['html'], stage)
+            if has_markup:
+                cache.stats['fresh'] += 1
+                self._archive_html(url, stage, cached['html'])
+                return result
+            # 필요한 요소가 없는 캐시 항목은 없는 것으로 보고 다시 받음
+            cached = None
         
+        # HTTP 모드이거나, 브라우저 모드라도 재검증할 캐시 항목이 있으면 HTTP로 요청
+        validators = cache.conditional_headers(cached) if cached is not None else {}
+        if self.http_fetcher is not None and (self.fetch_mode == 'http' or validators):
+            async with self.rate_limiter.slot(url) as slot:
+                response = await self.http_fetcher.fetch_response(url, headers=validators or None,
+                                                                  raise_errors=True)
+                if response is not None:
+                    slot.status = response[0]
+            if response is not None:
+                status, html, headers = response
+                if status >= 500:
+                    raise FetchError('5xx', f"HTTP {status}: {url}")
+                if status == 429:
+                    raise FetchError('429', f"HTTP 429: {url}")
+                if status == 304 and cached is not None:
+                    has_markup, result = await self._process(cached['html'], stage)
+                    if has_markup:
+                        cache.refresh(key)
+                        cache.stats['revalidated'] += 1
+                        self._archive_html(url, stage, cached['html'])
+                        return result
+                elif status == 200 and html:
+                    # 받은 HTML은 추출 결과와 관계없이 먼저 보관 (구조가 바뀐 페이지도 다시 추출할 수 있도록)
+                    self._archive_html(url, stage, html)
+                    has_markup, result = await self._process(html, stage)
+                    if has_markup:
+                        if cache is not None:
+                            cache.put(key, url, html, headers.get('ETag'), headers.get('Last-Modified'))
+                            cache.stats['stored'] += 1
+                        return result
+            if self.fetch_mode == 'http':
+                print("  → 정적 HTML에 필요한 요소가 없어 브라우저로 다시 시도합니다")
+                self.browser_fallbacks += 1
+        
+        async with self.browser_pool.page() as page:
+            condition = await self._goto(page, url, stage)
+            content = await page.content()
+        # 추출 결과와 관계없이 먼저 보관 (구조가 바뀐 페이지도 나중에 다시 추출할 수 있도록)
+        self._archive_html(url, stage, content)
+        has_markup, result = await self._process(content, stage)
+        if not has_markup and stage == 'article' and condition == 'timeout':
+            # load 이벤트도 오지 않은 채 요소가 없으면 덜 받아진 페이지로 보고 다시 시도
+            raise FetchError('parse', f"기사 페이지가 덜 받아졌습니다: {url}")
+        if has_markup and cache is not None:
+            cache.put(key, url, content)
+            cache.stats['stored'] += 1
+        # 다 받아졌는데도 요소가 없으면(구조 변경) 대체 규칙으로 추출한 결과 반환
+        return result
+    
+    async def _fetch_with_retry(self, url, stage):
+        """재시도 정책에 따라 페이지를 가져와 파싱 (마지막 시도까지 실패하면 예외 발생)"""
+        return await self.retry_policy.call(url, stage, lambda: self._fetch_document(url, stage))
+    
+    def _archive_html(self, url, stage, html):
+        """원본 HTML 보관 (보관소를 사용할 때만)"""
+        if self.html_archive is not None:
+            self.html_archive.add(url, stage, html)
+    
+    def _list_page_url(self, list_url, page_no):
+        """목록 페이지 번호에 해당하는 URL (1페이지는 원래 URL 그대로)"""
+        if page_no <= 1:
+            return list_url
+        parts = urlparse(list_url)
+        query = [(k, v) for k, v in parse_qsl(parts.query) if k != LIST_PAGE_PARAM]
+        query.append((LIST_PAGE_PARAM, str(page_no)))
+        return urlunparse(parts._replace(query=urlencode(query)))
+    
+    async def crawl_list_page(self, list_url, max_articles=10, max_pages=DEFAULT_MAX_LIST_PAGES,
+                              on_found=None, seen=None):
+        """카테고리 목록 페이지에서 기사 목록 수집 (날짜 필터링 포함)
+        
+        목록은 최신순이므로 1페이지부터 차례로 보다가, 페이지의 마지막 항목이
+        타겟 날짜(기간 모드에서는 시작 날짜)보다 오래되면 그 뒤 페이지는 보지 않는다.
+        다음 페이지는 현재 페이지를 처리하는 동안 미리 요청해 둔다.
+        max_articles가 None이면 개수 제한 없이 수집한다.
+        on_found: 기사를 찾을 때마다 바로 호출할 비동기 함수 (URL과 목록 날짜를 받고, False를 반환하면
+                  탐색 종료, 이때는 찾은 URL과 날짜를 기록하지 않고 빈 목록 반환)
+        seen: 이 목록 안의 중복 확인에 사용할 집합 (기본값: set, 긴 기간은 BloomFilter)
+        """
         article_links = []
-        target_date_str = self.target_date.strftime('%Y-%m-%d')
+        found = 0
+        frontier = UrlFrontier(seen=seen)
+        stopped = False
+        start_date_str = self.start_date.strftime('%Y-%m-%d')
         
-        # li 태그 안에 링크와 날짜가 함께 있음
-        for li in soup.find_all('li'):
-            # 링크 찾기
-            link = li.find('a', href=True)
-            if not link:
-                continue
-            
-            href = link['href']
-            if 'view.php' not in href or 'idx=' not in href:
-                continue
-            
-            # 같은 li 안에서 날짜 찾기 (dd.registDate)
-            date_dd = li.find('dd', class_=lambda x: x and 'registDate' in x)
-            if date_dd:
-                date_str = date_dd.get_text(strip=True)
+        def fetch_page(page_no):
+            page_url = self._list_page_url(list_url, page_no)
+            print(f"\n목록 페이지 접속 중: {page_url}")
+            return asyncio.ensure_future(self._fetch_with_retry(page_url, 'list'))
+        
+        page_no = 1
+        current = fetch_page(page_no)
+        try:
+            while current is not None:
+                entries = await current
+                current = fetch_page(page_no + 1) if page_no < max_pages else None
                 
-                # 타겟 날짜와 일치하는 경우만 수집
-                if date_str == target_date_str:
-                    # 상대 경로를 절대 경로로 변환
-                    if href.startswith('http'):
-                        full_url = href
-                    elif href.startswith('/'):
-                        full_url = self.base_url + href
-                    else:
-                        full_url = self.base_url + '/' + href
+                # li 태그 안에 링크와 날짜(dd.registDate)가 함께 있음
+                dates = []
+                for entry in entries:
+                    href = entry['href']
+                    if 'view.php' not in href or 'idx=' not in href:
+                        continue
                     
-                    # mcode 파라미터 제거 (중복 방지)
-                    if '&mcode=' in full_url:
-                        full_url = full_url.split('&mcode=')[0]
+                    date_str = entry['date']
+                    if date_str and DATE_PATTERN.match(date_str):
+                        dates.append(date_str)
                     
-                    if full_url not in article_links:
-                        # 제목 추출
-                        title_dt = li.find('dt', class_=lambda x: x and 'title' in x)
-                        if title_dt:
-                            title_link = title_dt.find('a')
-                            title = title_link.get_text(strip=True) if title_link else "제목 없음"
-                        else:
-                            title = "제목 없음"
+                    # 타겟 날짜(기간)와 일치하는 경우만 수집
+                    if self._in_date_range(date_str):
+                        # 정규화 (mcode 등 idx 외 파라미터 제거, 중복 방지)
+                        full_url = canonical_url(href, self.base_url)
                         
-                        print(f"  ✓ 오늘 날짜 기사 발견: {title[:50]}... (날짜: {date_str})")
-                        article_links.append(full_url)
-                        
-                        if len(article_links) >= max_articles:
-                            break
+                        if frontier.add(full_url) and not self._already_crawled(full_url):
+                            title = entry['title'] or "제목 없음"
+                            print(f"  ✓ 오늘 날짜 기사 발견: {title[:50]}... (날짜: {date_str})")
+                            found += 1
+                            
+                            if on_found is None:
+                                article_links.append(full_url)
+                                self.article_dates[full_url] = date_str
+                            elif not await on_found(full_url, date_str):
+                                stopped = True
+                            if stopped or _reached(found, max_articles):
+                                break
+                
+                if stopped or _reached(found, max_articles):
+                    break
+                if not dates:
+                    print("  → 기사 항목이 없는 페이지, 목록 탐색 종료")
+                    break
+                if dates[-1] < start_date_str:
+                    # 최신순 목록에서 마지막 항목이 더 오래되었으면 이후 페이지에는 대상이 없음
+                    print(f"  → {start_date_str} 이전 기사에 도달, 목록 탐색 종료 ({page_no}페이지)")
+                    break
+                page_no += 1
+        finally:
+            # 필요 없어진 다음 페이지 미리 요청 취소
+            if current is not None and not current.done():
+                current.cancel()
+                await asyncio.gather(current, return_exceptions=True)
         
         return article_links
     
-    async def crawl_article_list(self, page, max_articles=10):
+    def _category_list_url(self, category):
+        """분류 코드(mcode)의 목록 페이지 URL"""
+        return f"{self.base_url}/news/list.php?{urlencode({'mcode': category})}"
+    
+    async def discover_articles(self, frontier, use_list_page=True, categories=DEFAULT_CATEGORIES,
+                                max_articles=10, max_pages=DEFAULT_MAX_LIST_PAGES):
+        """목록을 탐색하면서 새 기사 URL을 찾는 즉시 frontier(UrlFrontier)에 넣음 (발견한 기사 수 반환)
+        
+        여러 분류를 동시에 탐색하며, 같은 기사(idx)는 한 번만 넣고 실린 분류는 모두
+        self.article_categories에 기록한다. 기사의 categories는 상세 수집 시점까지
+        기록된 분류이므로, 그 뒤에 다른 분류 목록에서 찾은 분류는 빠질 수 있다. max_articles는 분류 전체에 대해 적용되고,
+        frontier가 가득 차면 상세 수집이 따라올 때까지 탐색이 기다린다.
+        탐색이 끝나거나 실패하면 frontier를 닫는다.
+        """
+        started = time.perf_counter()
+        
+        def list_seen():
+            # BloomFilter 사용 시 분류별 목록 안의 중복 확인도 BloomFilter로 (메모리 절약)
+            return frontier.seen.empty_copy() if isinstance(frontier.seen, BloomFilter) else None
+        
+        def full():
+            return max_articles is not None and frontier.added >= max_articles
+        
+        async def offer(url, category=None, date_str=None):
+            if full():
+                return False
+            if not frontier.add(url):
+                # 다른 분류에서 이미 찾은 기사 (실린 분류만 추가)
+                categories_of = self.article_categories.get(url)
+                if category and categories_of is not None and category not in categories_of:
+                    categories_of.append(category)
+                return True
+            self.article_categories[url] = [category] if category else []
+            if date_str:
+                self.article_dates[url] = date_str
+            self.discovered_count = frontier.added
+            self._emit('found', url=url, total=frontier.added)
+            await frontier.put(url)
+            return not full()
+        
+        try:
+            if use_list_page:
+                # 카테고리 목록 페이지에서 수집 (한 분류의 탐색이 실패해도 다른 분류는 계속)
+                results = await asyncio.gather(*(
+                    self.crawl_list_page(self._category_list_url(category), None, max_pages,
+                                         on_found=lambda url, date_str, category=category: offer(url, category, date_str),
+                                         seen=list_seen())
+                    for category in categories
+                ), return_exceptions=True)
+                for category, result in zip(categories, results):
+                    if isinstance(result, BaseException):
+                        self._discovery_failed(f"분류 {category}", result)
+                if len(categories) > 1:
+                    print(f"\n분류 {len(categories)}개에서 기사 {frontier.added}개 발견 (중복 {frontier.duplicates}개 제외)")
+            else:
+                # 메인 페이지에서 수집
+                try:
+                    urls = await self.crawl_article_list(max_articles)
+                except Exception as e:
+                    self._discovery_failed("메인 페이지", e)
+                    urls = []
+                for url in urls:
+                    await offer(url)
+        except Exception:
+            await frontier.close()
+            raise
+        await frontier.close()
+        
+        self._emit('discovered', total=frontier.added, elapsed=time.perf_counter() - started)
+        if self.crawl_state is not None:
+            print(f"\n이전 실행에서 수집한 기사 {self.skipped_seen}개 건너뜀")
+        return frontier.added
+    
+    def _discovery_failed(self, where, error):
+        """목록 탐색 실패 기록 (이미 찾은 기사는 계속 수집하고 결과를 일부로 표시)"""
+        self.partial = True
+        print(f"\n✗ 목록 탐색 실패 ({where}): {error}")
+        print("  → 지금까지 찾은 기사만 수집해서 저장합니다")
+    
+    async def crawl_article_list(self, max_articles=10):
         """메인 페이지에서 기사 목록 수집 (날짜 필터링 포함)"""
         print(f"메인 페이지 접속 중: {self.base_url}")
-        await page.goto(self.base_url, wait_until="networkidle")
-        await asyncio.sleep(2)  # 페이지 로딩 대기
-        
         # 페이지 HTML 가져오기
-        content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
+        entries = await self._fetch_with_retry(self.base_url, 'main')
         
         # 기사 링크와 날짜 정보를 함께 수집
         article_links = []
-        target_date_str = self.target_date.strftime('%Y-%m-%d')
+        frontier = UrlFrontier()
         
-        # tab_item 클래스를 가진 li 태그 찾기
-        for li in soup.find_all('li', class_=lambda x: x and 'tab_item' in x):
-            # 링크 찾기
-            link = li.find('a', href=True)
-            if not link:
-                continue
-            
-            href = link['href']
+        # tab_item 클래스를 가진 li 태그 (날짜: span.tab_data > time.time)
+        for entry in entries:
+            href = entry['href']
             if 'view.php' not in href or 'idx=' not in href:
                 continue
             
-            # 같은 li 안에서 날짜 찾기 (span.tab_data > time.time)
-            time_tag = li.find('time', class_=lambda x: x and 'time' in x)
-            if time_tag:
-                date_str = time_tag.get_text(strip=True)
+            # 타겟 날짜(기간)와 일치하는 경우만 수집
+            date_str = entry['date']
+            if self._in_date_range(date_str):
+                full_url = canonical_url(href, self.base_url)
                 
-                # 타겟 날짜와 일치하는 경우만 수집
-                if date_str == target_date_str:
-                    # 상대 경로를 절대 경로로 변환
-                    if href.startswith('http'):
-                        full_url = href
-                    elif href.startswith('/'):
-                        full_url = self.base_url + href
-                    else:
-                        full_url = self.base_url + '/' + href
+                if frontier.add(full_url) and not self._already_crawled(full_url):
+                    title = entry['title'] or "제목 없음"
+                    print(f"  ✓ 오늘 날짜 기사 발견: {title[:50]}... (날짜: {date_str})")
+                    article_links.append(full_url)
+                    self.article_dates[full_url] = date_str
                     
-                    if full_url not in article_links:
-                        # 제목 추출
-                        title_tag = li.find('strong', class_=lambda x: x and 'headline' in x)
-                        title = title_tag.get_text(strip=True) if title_tag else "제목 없음"
-                        print(f"  ✓ 오늘 날짜 기사 발견: {title[:50]}... (날짜: {date_str})")
-                        article_links.append(full_url)
-                        
-                        if len(article_links) >= max_articles:
-                            break
+                    if _reached(len(article_links), max_articles):
+                        break
         
-        print(f"\n오늘 날짜({target_date_str}) 기사 {len(article_links)}개 발견")
+        print(f"\n대상 날짜({self._date_label()}) 기사 {len(article_links)}개 발견")
         return article_links
     
+    def _date_label(self):
+        """출력용 대상 날짜/기간 문자열"""
+        if self.is_range:
+            return f"{self.start_date.strftime('%Y-%m-%d')} ~ {self.end_date.strftime('%Y-%m-%d')}"
+        return self.target_date.strftime('%Y-%m-%d')
+    
+    def _article_day(self, article):
+        """기사가 속한 날짜 (목록의 등록일, 없으면 기사 등록일시, 그래도 없으면 시작 날짜)"""
+        for date_str in (self.article_dates.get(article['url']), (article.get('date') or '')[:10]):
+            if date_str and DATE_PATTERN.match(date_str):
+                return date.fromisoformat(date_str)
+        return self.start_date
+    
+    def articles_by_date(self, articles=None):
+        """기사를 날짜별로 나눔 {date: [article, ...]} (날짜순)"""
+        partitions = {}
+        for article in (self.articles if articles is None else articles):
+            partitions.setdefault(self._article_day(article), []).append(article)
+        return dict(sorted(partitions.items()))
+    
+    def _already_crawled(self, url):
+        """증분 모드에서 이전 실행에 이미 수집한 기사인지 확인"""
+        if self.crawl_state is not None and self.crawl_state.is_seen(url):
+            self.skipped_seen += 1
+            return True
+        return False
+    
     def _is_target_date(self, article_date_str):
         """기사 날짜가 타겟 날짜인지 확인"""
         if not article_date_str:
@@ -193,246 +491,452 @@ class HanmiCrawler:
         except:
             return False
     
-    async def crawl_article_detail(self, page, url):
+    def _emit(self, event, **fields):
+        """진행 이벤트 전달 ({'event': 'found' / 'discovered' / 'fetched' / 'failed', 'time': 발생 시각, ...})
+        
+        progress 콜백은 크롤러의 이벤트 루프 스레드에서 호출되므로
+        GUI 등에서는 스레드 안전한 큐에 넣기만 해야 한다.
+        """
+        if self.progress is not None:
+            fields['event'] = event
+            fields['time'] = time.monotonic()
+            self.progress(fields)
+    
+    async def crawl_article_detail(self, url):
         """개별 기사 상세 정보 수집"""
+        started = time.perf_counter()
         try:
             print(f"\n기사 크롤링 중: {url}")
-            await page.goto(url, wait_until="networkidle")
-            await asyncio.sleep(1)
             
-            content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            # 기사 정보 추출 (title, content, date, author), 추출 실패도 재시도 대상
+            article = {'url': url}
+            article.update(await self._fetch_with_retry(url, 'article'))
+            # 수집 시점까지 찾은 분류 (이후 다른 분류 목록에서 찾아도 이미 출력된 기사에는 반영되지 않음)
+            article['categories'] = list(self.article_categories.get(url, []))
+            article['crawled_at'] = datetime.now().isoformat()
             
-            # 기사 정보 추출
-            article = {
-                'url': url,
-                'title': self._extract_title(soup),
-                'content': self._extract_content(soup),
-                'date': self._extract_date(soup),
-                'author': self._extract_author(soup),
-                'crawled_at': datetime.now().isoformat()
-            }
+            # 필드별 적용된 추출 규칙 기록 (사이트 구조 변경 감지용)
+            rules = article.pop('rules')
+            for field, rule in rules.items():
+                self.extraction_rules[(field, rule)] += 1
+            
+            # 제목/본문 추출에 실패한 기사는 수집 이력에 남기지 않음 (다음 실행에서 다시 수집)
+            if rules['title'] == 'none' or rules['content'] == 'none':
+                self.incomplete_articles.add(url)
             
             print(f"  ✓ 수집 완료: {article['title'][:50]}")
+            self._emit('fetched', url=url, title=article['title'], elapsed=time.perf_counter() - started)
             return article
         except Exception as e:
-            print(f"  ✗ 크롤링 실패: {e}")
+            kind = classify_error(e)
+            if self.forget_fetched:
+                self._forget(url)
+            print(f"  ✗ 크롤링 실패 ({kind}): {e}")
+            self._emit('failed', url=url, error=str(e), kind=kind, elapsed=time.perf_counter() - started)
             return None
     
-    def _extract_title(self, soup):
-        """제목 추출"""
-        # og:title 메타 태그에서 추출
-        meta_title = soup.find('meta', {'property': 'og:title'})
-        if meta_title and meta_title.get('content'):
-            return meta_title['content']
-        
-        # title 태그에서 추출
-        title_tag = soup.find('title')
-        if title_tag:
-            return title_tag.get_text(strip=True)
-        
-        return "제목 없음"
-    
-    def _extract_content(self, soup):
-        """본문 추출"""
-        # fr-view 클래스에서 본문 추출
-        content_div = soup.find('div', {'class': 'fr-view'})
-        if content_div:
-            # 스크립트, 스타일 태그 제거
-            for script in content_div(['script', 'style', 'img']):
-                script.decompose()
-            return content_div.get_text(strip=True, separator='\n')
-        
-        # viewContent 클래스 시도
-        content_div = soup.find('div', {'class': 'viewContent'})
-        if content_div:
-            for script in content_div(['script', 'style']):
-                script.decompose()
-            return content_div.get_text(strip=True, separator='\n')
-        
-        return "본문 없음"
+    def _print_extraction_rules(self):
+        """필드별 추출 규칙 통계 출력 (대체 규칙이 쓰였으면 구조 변경 가능성 안내)"""
+        if not self.extraction_rules:
+            return
+        summary = ', '.join(
+            f"{field}/{rule} {count}"
+            for (field, rule), count in sorted(self.extraction_rules.items())
+        )
+        print(f"추출 규칙: {summary}")
+        
+        missing = sorted({field for (field, rule) in self.extraction_rules if rule == 'none'})
+        if missing:
+            print(f"  ⚠️ 추출하지 못한 항목이 있습니다 ({', '.join(missing)}). 사이트 구조가 바뀌었는지 확인하세요.")
     
-    def _extract_date(self, soup):
-        """날짜 추출"""
-        # 기사 정보 영역에서 "등록 YYYY-MM-DD HH:MM:SS" 형식 찾기
-        info_list = soup.find('ul', class_=lambda x: x and 'info-text' in x)
-        if info_list:
-            for li in info_list.find_all('li'):
-                text = li.get_text(strip=True)
-                # "등록 2026-02-01 14:14:16" 형식 파싱
-                match = re.search(r'등록\s+(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})', text)
-                if match:
-                    return f"{match.group(1)} {match.group(2)}"
-        
-        # article:published_time 메타 태그
-        meta_date = soup.find('meta', {'property': 'article:published_time'})
-        if meta_date and meta_date.get('content'):
-            return meta_date['content']
-        
-        # time 태그
-        time_tag = soup.find('time')
-        if time_tag:
-            return time_tag.get_text(strip=True)
-        
-        return None
+    def _forget(self, url):
+        """수집이 끝난 기사의 목록 날짜/분류 기록 삭제 (BloomFilter 사용 시 메모리를 일정하게 유지)"""
+        self.article_dates.pop(url, None)
+        self.article_categories.pop(url, None)
     
-    def _extract_author(self, soup):
-        """저자 추출"""
-        # 기사 정보 영역에서 기자 이름 찾기 (info-text 클래스)
-        info_list = soup.find('ul', class_=lambda x: x and 'info-text' in x)
-        if info_list:
-            for li in info_list.find_all('li'):
-                text = li.get_text(strip=True)
-                # "김영 기자" 형식 찾기
-                if '기자' in text and '등록' not in text:
-                    return text
-        
-        # 기사 하단의 프로필 영역에서 찾기
-        writer_strong = soup.find('strong', class_=lambda x: x and 'writer' in x)
-        if writer_strong:
-            return writer_strong.get_text(strip=True)
-        
-        # author 메타 태그
-        meta_author = soup.find('meta', {'name': 'author'})
-        if meta_author and meta_author.get('content'):
-            return meta_author['content']
-        
-        # 일반적인 저자 표시 영역
-        author_span = soup.find('span', {'class': ['author', 'reporter', 'writer']})
-        if author_span:
-            return author_span.get_text(strip=True)
-        
-        return None
+    async def stream_articles(self, urls, window=None):
+        """기사 상세 정보를 동시에 수집하면서 수집되는 대로 하나씩 내보냄 (목록 순서 유지)
+        
+        urls는 URL 목록이나 비동기 반복 객체(목록 탐색과 동시에 진행할 때)이다.
+        동시 실행 수는 브라우저 풀 크기와 호스트별 요청 제한으로 정해지고,
+        미리 시작해 두는 작업은 window개(기본값: 동시 실행 수의 2배)로 제한되므로
+        기사가 많아도 메모리 사용량이 일정하다. 다음 URL과 맨 앞 기사 중 먼저 준비되는
+        쪽을 처리하므로, 목록 탐색이 다음 URL을 찾는 동안에도 끝난 기사는 바로 내보낸다.
+        """
+        window = window if window else self.concurrency * 2
+        pending = deque()
+        url_iter = _as_async_iter(urls)
+        next_url = None
+        exhausted = False
+        try:
+            while not exhausted or pending:
+                # 창이 찼으면 맨 앞 기사가 끝날 때까지 다음 URL을 받지 않음
+                if next_url is None and not exhausted and len(pending) < window:
+                    next_url = asyncio.ensure_future(url_iter.__anext__())
+                waiting = [task for task in (next_url, pending[0] if pending else None) if task is not None]
+                await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                
+                if next_url is not None and next_url.done():
+                    try:
+                        url = next_url.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        pending.append(asyncio.ensure_future(self.crawl_article_detail(url)))
+                    next_url = None
+                
+                # 끝난 기사는 목록 순서대로 바로 내보냄
+                while pending and pending[0].done():
+                    article = pending.popleft().result()
+                    if article:
+                        yield article
+        finally:
+            # 소비가 중단되면 남은 작업을 취소하고 끝날 때까지 기다림 (페이지 반환 후 브라우저 종료)
+            if next_url is not None:
+                next_url.cancel()
+                await asyncio.gather(next_url, return_exceptions=True)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await url_iter.aclose()
     
-    async def run(self, max_articles=10, use_list_page=True, email_config=None):
-        """크롤러 실행"""
+    async def run(self, max_articles=10, use_list_page=True, email_config=None,
+                  concurrency=1, request_interval=1.0, fetch_mode='browser', readiness=None,
+                  block_resources=True, resource_filter=None, parser='lxml',
+                  use_cache=False, fetch_cache=None, incremental=False, crawl_state=None,
+                  delta_only=True, max_list_pages=DEFAULT_MAX_LIST_PAGES, categories=DEFAULT_CATEGORIES,
+                  sinks=None, collect=True, use_archive=False, archive=None,
+                  archive_html=False, html_archive=None, browser_pool=None, browser_endpoint=None,
+                  use_profile=False, browser_profile=None, progress=None, cancel_token=None,
+                  retry_policy=None, adaptive_rate=False, rate_limiter=None, bloom_filter=None,
+                  use_parse_pool=False, parse_pool=None):
+        """크롤러 실행
+        
+        concurrency: 동시에 사용할 페이지(탭) 수
+        request_interval: 같은 호스트에 대한 요청 시작 간격(초, adaptive_rate 사용 시 시작 속도)
+        fetch_mode: 'browser' (Playwright) 또는 'http' (정적 HTML, 필요 시 브라우저로 대체)
+        readiness: 페이지 준비 판단 정책 (ReadinessPolicy, 기본값: 단계별 필수 요소 대기)
+        block_resources: 이미지/폰트/스타일시트/광고 등 불필요한 요청 차단 여부
+        resource_filter: 차단 규칙 (ResourceFilter, 기본값: 기본 차단 목록)
+        parser: HTML 파서 백엔드 ('html.parser', 'lxml', 'selectolax')
+        use_cache: 디스크 페이지 캐시 사용 여부 (재실행 시 변경되지 않은 페이지는 다시 받지 않음)
+        fetch_cache: 사용할 캐시 (FetchCache, 기본값: .hanmi_cache 폴더)
+        incremental: 이전 실행에서 수집한 기사는 건너뛰고 새 기사만 수집
+        crawl_state: 수집 이력 저장소 (CrawlState, 기본값: hanmi_crawl_state.sqlite)
+        delta_only: 증분 모드에서 새 기사만 저장/전송할지 여부
+                    (False면 같은 날짜의 이전 수집 기사도 함께 저장/전송)
+        max_list_pages: 목록 페이지 최대 탐색 페이지 수
+        categories: 목록 페이지에서 동시에 탐색할 분류 코드(mcode) 목록
+        sinks: 기사가 수집될 때마다 받을 출력 대상 목록 (JsonlSink, ProgressSink 등)
+        collect: 기사를 모아 두었다가 마지막에 엑셀/이메일로 출력할지 여부
+                 (False면 sinks로만 출력하고 메모리에 쌓지 않음)
+        use_archive: 결과를 날짜별 Parquet 보관소에도 추가할지 여부
+        archive: 사용할 보관소 (ArticleArchive, 기본값: hanmi_archive 폴더)
+        archive_html: 가져온 목록/기사 페이지의 원본 HTML을 보관할지 여부 (reextract.py로 재추출)
+        html_archive: 사용할 원본 HTML 보관소 (HtmlArchive, 기본값: hanmi_html_archive 폴더)
+        browser_pool: 여러 실행에 걸쳐 재사용할 브라우저 풀 (BrowserPool, 실행 후 닫지 않고 reset만 함)
+        browser_endpoint: 연결할 브라우저 서비스 주소 (예: 'http://127.0.0.1:9222', browser_service.py)
+        use_profile: 유지되는 브라우저 프로필로 실행할지 여부 (정적 파일 캐시, 쿠키를 다음 실행에도 사용)
+        browser_profile: 사용할 프로필 (BrowserProfile, 기본값: .hanmi_browser_profile 폴더, 디스크 캐시 100MB)
+        progress: 진행 이벤트를 받을 함수 (이벤트 dict 하나를 인자로 받음)
+                  - found: url, total(지금까지 발견한 기사 수), 목록 탐색 중 기사를 찾을 때마다
+                  - discovered: total(수집할 기사 수), elapsed(목록 탐색 시간), 탐색이 끝났을 때
+                  - fetched: url, title, elapsed(기사 수집 시간)
+                  - failed: url, error, kind(오류 종류), elapsed
+        cancel_token: 중지 신호 (CancelToken, 다른 스레드에서 cancel() 호출 시 진행 중인 수집을 멈추고
+                      지금까지 수집한 기사만 저장/전송, 중지되었으면 self.cancelled가 True,
+                      수집이 끝난 뒤 저장/전송 중에 온 요청은 무시)
+        목록 탐색이 실패하면 그때까지 찾은 기사만 수집해서 저장/전송하고 self.partial이 True
+        retry_policy: 목록/기사 페이지 재시도 정책 (RetryPolicy, 기본값: 최대 3번 시도, 지수 백오프,
+                      호스트별 차단기)
+        adaptive_rate: 응답 시간과 429/5xx/오류에 따라 요청 속도와 동시 실행 수를 자동 조절할지 여부
+                       (동시 실행 수는 concurrency까지)
+        rate_limiter: 사용할 요청 제한 (HostRateLimiter 또는 AdaptiveRateLimiter, 지정하면
+                      request_interval/adaptive_rate 대신 사용)
+        bloom_filter: 수집한 기사를 기록할 BloomFilter (아주 긴 기간 수집 시 메모리 절약, 지정하면
+                      중복 확인에 집합 대신 BloomFilter를 쓰고 목록 날짜/분류 기록은 수집 후 지움,
+                      기사는 수집을 마친 뒤에만 기록되어 다음 실행에서 건너뜀)
+        use_parse_pool: HTML 파싱과 기사 추출을 이벤트 루프 밖의 작업자 풀에서 할지 여부
+                        (긴 기사를 파싱하는 동안에도 다른 페이지 수집이 멈추지 않음)
+        parse_pool: 사용할 작업자 풀 (ParsePool, 기본값: CPU 수만큼의 프로세스, parser 백엔드 사용)
+        """
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"지원하지 않는 수집 방식입니다: {fetch_mode}")
+        
+        concurrency = max(1, int(concurrency))
+        self.concurrency = concurrency
+        self.progress = progress
+        if isinstance(categories, str):
+            categories = [categories]
+        categories = list(dict.fromkeys(categories))
+        self.article_categories = {}
+        self.incomplete_articles = set()
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        elif adaptive_rate:
+            initial_rate = 1.0 / request_interval if request_interval > 0 else 10.0
+            self.rate_limiter = AdaptiveRateLimiter(initial_rate=initial_rate, max_concurrency=concurrency)
+        else:
+            self.rate_limiter = HostRateLimiter(min_interval=request_interval, max_per_host=concurrency)
+        self.browser_fallbacks = 0
+        self.retry_policy = retry_policy if retry_policy else RetryPolicy()
+        self.readiness = readiness if readiness else ReadinessPolicy()
+        self.parser = get_parser(parser)
+        
+        # 파싱 작업자 풀 (직접 만든 풀만 실행 후 닫음)
+        owns_parse_pool = use_parse_pool and parse_pool is None
+        if use_parse_pool:
+            self.parse_pool = parse_pool if parse_pool else ParsePool(parser)
+        else:
+            self.parse_pool = None
+        
         # PyInstaller 환경에서 브라우저 경로 설정
         self._get_browser_path()
         
-        async with async_playwright() as p:
-            # 브라우저 실행
-            try:
-                browser = await p.chromium.launch(headless=True)
-            except Exception as e:
-                error_msg = str(e)
-                if "Executable doesn't exist" in error_msg or "browser" in error_msg.lower():
-                    raise Exception(
-                        "Playwright 브라우저가 설치되어 있지 않습니다.\n\n"
-                        "설치 방법:\n"
-                        "1. 명령 프롬프트(cmd)를 관리자 권한으로 실행\n"
-                        "2. 다음 명령어 입력:\n"
-                        "   playwright install chromium\n\n"
-                        "또는 install_browser.bat 파일을 실행하세요."
-                    )
-                else:
-                    raise e
-            
-            page = await browser.new_page()
-            
+        # 브라우저는 실제로 필요할 때 실행됨
+        if block_resources:
+            self.resource_filter = resource_filter if resource_filter else ResourceFilter()
+        else:
+            self.resource_filter = None
+        owns_pool = browser_pool is None
+        if owns_pool:
+            profile = None
+            if use_profile:
+                from browser_profile import BrowserProfile
+                profile = browser_profile if browser_profile else BrowserProfile()
+            self.browser_pool = BrowserPool(size=concurrency, resource_filter=self.resource_filter,
+                                            endpoint=browser_endpoint, profile=profile)
+        else:
+            # 이미 실행 중인 브라우저를 재사용하고 이번 실행의 설정만 반영
+            browser_pool.configure(size=concurrency, resource_filter=self.resource_filter)
+            self.browser_pool = browser_pool
+        self.fetch_mode = fetch_mode
+        
+        # 페이지 캐시 (직접 만든 캐시만 실행 후 닫음)
+        owns_cache = use_cache and fetch_cache is None
+        if use_cache:
+            self.fetch_cache = fetch_cache if fetch_cache else FetchCache()
+        else:
+            self.fetch_cache = None
+        
+        # 수집 이력 (직접 만든 저장소만 실행 후 닫음)
+        owns_state = incremental and crawl_state is None
+        if incremental:
+            self.crawl_state = crawl_state if crawl_state else CrawlState()
+        else:
+            self.crawl_state = None
+        self.skipped_seen = 0
+        
+        # 날짜별 기사 보관소 (pyarrow 선택 설치)
+        if use_archive:
+            from article_archive import ArticleArchive
+            self.article_archive = archive if archive else ArticleArchive()
+        else:
+            self.article_archive = None
+        
+        # 원본 HTML 보관소 (직접 만든 보관소만 실행 후 닫음)
+        owns_html_archive = archive_html and html_archive is None
+        if archive_html:
+            from html_archive import HtmlArchive
+            self.html_archive = html_archive if html_archive else HtmlArchive()
+        else:
+            self.html_archive = None
+        
+        # 수집된 기사를 받을 출력 대상 (마지막 엑셀/이메일 출력용 집계 포함)
+        aggregate = AggregateSink() if collect else None
+        stream_sinks = list(sinks or [])
+        if aggregate is not None:
+            stream_sinks.append(aggregate)
+        
+        # HTTP 클라이언트는 HTTP 모드와 캐시 재검증에 사용
+        if fetch_mode == 'http' or self.fetch_cache is not None:
+            from http_fetcher import HttpFetcher
+            self.http_fetcher = HttpFetcher(max_connections=concurrency)
+            await self.http_fetcher.start()
+        else:
+            self.http_fetcher = None
+        
+        try:
+            # 중지 요청 시 지금까지 수집한 기사만 저장하고 정리
+            new_count = 0
+            sinks_opened = False
+            self.cancelled = False
+            self.partial = False
             try:
-                article_urls = []
+                if cancel_token is not None:
+                    cancel_token.attach()
                 
-                if use_list_page:
-                    # 카테고리 목록 페이지에서 수집 (더 많은 기사 확인 가능)
-                    list_url = f"{self.base_url}/news/list.php?mcode=m93atmw"
-                    article_urls = await self.crawl_list_page(page, list_url, max_articles)
+                # 목록 탐색(생산자)이 찾은 기사를 바로 상세 수집(소비자)에 넘김
+                # (수집되는 대로 이력 기록 후 출력 대상에 전달, 전체 시간은 둘 중 긴 쪽에 가까움)
+                print(f"기사 목록 탐색과 상세 정보 수집 시작... (동시 {concurrency}개)")
+                if bloom_filter is not None:
+                    # 이번 실행의 중복 확인은 메모리 BloomFilter, bloom_filter에는 수집을 마친 기사만 기록
+                    frontier = UrlFrontier(maxsize=concurrency * 4, seen=bloom_filter.empty_copy(),
+                                           history=bloom_filter)
                 else:
-                    # 메인 페이지에서 수집
-                    article_urls = await self.crawl_article_list(page, max_articles)
+                    frontier = UrlFrontier(maxsize=concurrency * 4)
+                self.forget_fetched = bloom_filter is not None
+                discovery = asyncio.ensure_future(self.discover_articles(
+                    frontier, use_list_page, categories, max_articles, max_list_pages
+                ))
+                try:
+                    async for article in self.stream_articles(frontier):
+                        if not sinks_opened:
+                            # 전체 기사 수는 탐색이 끝나야 알 수 있음 (None)
+                            for sink in stream_sinks:
+                                sink.open(self, None)
+                            sinks_opened = True
+                        complete = article['url'] not in self.incomplete_articles
+                        if self.crawl_state is not None and complete:
+                            self.crawl_state.record(article, self._article_day(article))
+                        for sink in stream_sinks:
+                            sink.write(article)
+                        if complete:
+                            frontier.mark_done(article['url'])
+                        if self.forget_fetched:
+                            self._forget(article['url'])
+                        new_count += 1
+                    try:
+                        discovered = await discovery
+                    except Exception as e:
+                        # 탐색이 실패해도 이미 수집한 기사는 저장/전송
+                        self._discovery_failed("목록", e)
+                        discovered = frontier.added
+                finally:
+                    if not discovery.done():
+                        discovery.cancel()
+                        await asyncio.gather(discovery, return_exceptions=True)
                 
-                if not article_urls:
-                    print(f"\n오늘 날짜({self.target_date.strftime('%Y-%m-%d')})의 기사를 찾지 못했습니다.")
+                # 전체 내보내기(delta_only=False)는 새 기사가 없어도 이전 기사로 진행
+                if not discovered and (self.crawl_state is None or delta_only):
+                    print(f"\n대상 날짜({self._date_label()})의 기사를 찾지 못했습니다.")
                     return
-                
-                # 각 기사 상세 정보 수집
-                print(f"\n기사 상세 정보 수집 시작... (총 {len(article_urls)}개)")
-                for url in article_urls:
-                    article = await self.crawl_article_detail(page, url)
-                    if article:
-                        self.articles.append(article)
-                    await asyncio.sleep(1)  # 서버 부하 방지
-                
-                # 결과 저장 또는 이메일 전송
-                if self.articles:
+            except asyncio.CancelledError:
+                if cancel_token is None or not cancel_token.cancelled:
+                    raise
+                self.cancelled = True
+                _uncancel_current_task()
+                print(f"\n⚠️ 크롤링이 중지되었습니다. 지금까지 수집한 기사 {new_count}개만 저장합니다.")
+            
+            # 수집이 끝난 뒤(저장/전송, 정리 중)에는 중지 요청을 받지 않음
+            if cancel_token is not None:
+                cancel_token.detach()
+            
+            new_articles = aggregate.articles if aggregate is not None else []
+            self.articles.extend(new_articles)
+            
+            if self.crawl_state is not None:
+                if not delta_only and collect:
+                    # 같은 날짜(기간)에 이전 실행에서 수집한 기사 + 이번에 새로 수집한 기사
+                    new_urls = {article['url'] for article in new_articles}
+                    previous = []
+                    day = self.start_date
+                    while day <= self.end_date:
+                        previous.extend(
+                            article for article in self.crawl_state.articles_for(day)
+                            if article['url'] not in new_urls
+                        )
+                        day += timedelta(days=1)
+                    self.articles = previous + self.articles
+                print(f"새 기사 {new_count}개 수집")
+            
+            if self.crawl_state is not None and self.incomplete_articles:
+                print(f"\n⚠️ 제목/본문 추출에 실패한 기사 {len(self.incomplete_articles)}개는 이력에 기록하지 않음 (다음 실행에서 다시 수집)")
+            if self.partial:
+                print("\n⚠️ 목록 탐색이 일부 실패해서 찾은 기사만 수집했습니다")
+            if self.fetch_mode == 'http':
+                print(f"\n브라우저로 대체 수집한 페이지: {self.browser_fallbacks}개")
+            if self.retry_policy.failures:
+                print(f"요청 실패: {self.retry_policy.summary()}")
+            if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+                print(f"요청 속도: {self.rate_limiter.summary()}")
+            if self.fetch_cache is not None:
+                print(f"페이지 캐시: {self.fetch_cache.summary()}")
+            if self.html_archive is not None:
+                print(f"원본 HTML 보관: {self.html_archive.summary()}")
+            if self.parse_pool is not None:
+                print(f"파싱 작업자: {self.parse_pool.summary()}")
+            if self.readiness.stats:
+                print(f"페이지 준비 조건: {self.readiness.summary()}")
+            self._print_extraction_rules()
+            if self.resource_filter is not None and self.browser_pool.started:
+                print(f"브라우저 요청 필터: {self.resource_filter.summary()}")
+            
+            # 결과 저장 또는 이메일 전송 (기간 모드에서는 날짜별로 나눠서)
+            if self.articles:
+                if self.is_range:
+                    partitions = self.articles_by_date().items()
+                else:
+                    partitions = [(self.target_date, self.articles)]
+                for day, articles in partitions:
+                    if self.article_archive is not None:
+                        path = self.article_archive.append(articles, day)
+                        print(f"\n✓ 기사 보관소에 추가: {path}")
                     if email_config:
-                        self.send_email(email_config)
+                        self.send_email(email_config, articles, day)
                     else:
-                        self.save_results()
-                
-            finally:
-                await browser.close()
+                        self.save_results(articles, day)
+            
+        finally:
+            if cancel_token is not None:
+                cancel_token.detach()
+            if sinks_opened:
+                for sink in stream_sinks:
+                    sink.close()
+            if self.http_fetcher is not None:
+                await self.http_fetcher.close()
+            if owns_pool:
+                await self.browser_pool.close()
+            else:
+                await self.browser_pool.reset()
+            if owns_cache:
+                self.fetch_cache.close()
+            if owns_state:
+                self.crawl_state.close()
+            if owns_html_archive:
+                self.html_archive.close()
+            elif self.html_archive is not None:
+                # 넘겨받은 보관소는 닫지 않고 이번 실행에서 쓴 내용만 동기화
+                self.html_archive.sync()
+            if owns_parse_pool:
+                await self.parse_pool.close()
     
-    def save_results(self):
-        """결과를 JSON과 엑셀 파일로 저장"""
-        date_str = self.target_date.strftime('%Y%m%d')
+    def save_results(self, articles=None, target_date=None):
+        """결과를 JSON과 엑셀 파일로 저장 (기본값: 전체 기사, 타겟 날짜)"""
+        articles = self.articles if articles is None else articles
+        target_date = target_date if target_date else self.target_date
+        date_str = target_date.strftime('%Y%m%d')
         timestamp = datetime.now().strftime('%H%M%S')
         
         # JSON 파일 저장
         json_filename = f"hanmi_articles_{date_str}_{timestamp}.json"
         with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(self.articles, f, ensure_ascii=False, indent=2)
+            json.dump(articles, f, ensure_ascii=False, indent=2)
         print(f"\n✓ JSON 파일 저장 완료: {json_filename}")
         
         # 엑셀 파일 저장
         excel_filename = f"hanmi_articles_{date_str}_{timestamp}.xlsx"
-        self._save_to_excel(excel_filename)
-        print(f"✓ 엑셀 파일 저장 완료: {excel_filename}")
-        print(f"\n총 {len(self.articles)}개 기사 저장됨")
+        for filename in self._save_to_excel(excel_filename, articles):
+            print(f"✓ 엑셀 파일 저장 완료: {filename}")
+        print(f"\n총 {len(articles)}개 기사 저장됨")
     
-    def _save_to_excel(self, filename):
-        """엑셀 파일로 저장"""
-        # 데이터프레임 생성
-        df = pd.DataFrame(self.articles)
+    def _save_to_excel(self, filename, articles=None):
+        """엑셀 파일로 저장, 저장한 파일 이름 목록 반환 (행 수 한도를 넘으면 시트/파일을 나눔)"""
+        from excel_writer import ExcelArticleWriter
         
-        # 열 순서 재정렬
-        df = df[['title', 'author', 'date', 'content', 'url', 'crawled_at']]
-        
-        # 열 이름 한글로 변경
-        df.columns = ['제목', '저자', '등록일시', '본문', 'URL', '크롤링일시']
-        
-        # 엑셀 writer 생성
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='기사목록', index=False)
-            
-            # 워크시트 가져오기
-            worksheet = writer.sheets['기사목록']
-            
-            # 헤더 스타일 적용
-            header_font = Font(bold=True, size=11)
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-            
-            # 열 너비 조정
-            worksheet.column_dimensions['A'].width = 50  # 제목
-            worksheet.column_dimensions['B'].width = 25  # 저자
-            worksheet.column_dimensions['C'].width = 20  # 등록일시
-            worksheet.column_dimensions['D'].width = 120 # 본문
-            worksheet.column_dimensions['E'].width = 60  # URL
-            worksheet.column_dimensions['F'].width = 20  # 크롤링일시
-            
-            # 모든 셀에 텍스트 줄바꿈 적용
-            for row in worksheet.iter_rows(min_row=2, max_row=len(df)+1):
-                for cell in row:
-                    # 텍스트 줄바꿈 활성화
-                    cell.alignment = Alignment(
-                        wrap_text=True,
-                        vertical='top',
-                        horizontal='left'
-                    )
-                
-                # 행 높이를 본문 길이에 따라 조정
-                content_cell = row[3]  # 본문 셀 (D열)
-                if content_cell.value:
-                    # 본문 길이에 따라 행 높이 계산
-                    content_length = len(str(content_cell.value))
-                    estimated_lines = max(3, content_length // 120)
-                    worksheet.row_dimensions[cell.row].height = min(estimated_lines * 15, 400)
+        with ExcelArticleWriter(filename) as writer:
+            for article in (self.articles if articles is None else articles):
+                writer.write(article)
+        return writer.filenames
     
-    def send_email(self, email_config):
-        """이메일로 기사 전송"""
+    def send_email(self, email_config, articles=None, target_date=None):
+        """이메일로 기사 전송 (기본값: 전체 기사, 타겟 날짜)"""
         from email_sender import EmailSender
         
+        articles = self.articles if articles is None else articles
+        target_date = target_date if target_date else self.target_date
+        
         try:
             sender = EmailSender(
                 smtp_server=email_config['smtp_server'],
@@ -442,13 +946,13 @@ class HanmiCrawler:
             )
             
             success = sender.send_articles_email(
-                articles=self.articles,
+                articles=articles,
                 recipient_email=email_config['recipient_email'],
-                target_date=self.target_date
+                target_date=target_date
             )
             
             if success:
-                print(f"\n✓ 총 {len(self.articles)}개 기사를 이메일로 전송했습니다.")
+                print(f"\n✓ 총 {len(articles)}개 기사를 이메일로 전송했습니다.")
             else:
                 print("\n✗ 이메일 전송에 실패했습니다.")
                 
@@ -468,6 +972,10 @@ async def main():
     # from datetime import date
     # crawler = HanmiCrawler(target_date=date(2026, 2, 1))
     # await crawler.run(max_articles=10)
+    
+    # 기간 전체를 수집하려면 (날짜별로 파일 저장):
+    # crawler = HanmiCrawler(target_date=date(2026, 1, 1), end_date=date(2026, 1, 31))
+    # await crawler.run(max_articles=None)
 
 
 if __name__ == "__main__":
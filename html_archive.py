@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+원본 HTML 보관 모듈 (추가 전용, 오프라인 재추출용)
+"""
+import gzip
+import hashlib
+import os
+import sqlite3
+import time
+from collections import Counter
+from datetime import datetime
+
+
+DEFAULT_HTML_ARCHIVE_DIR = 'hanmi_html_archive'
+
+
+class HtmlArchive:
+    """가져온 목록/기사 페이지 HTML을 압축해서 계속 쌓아 두는 보관소
+
+    HTML은 날짜별 세그먼트 파일(segments/YYYYMMDD.gz)에 gzip 멤버로 하나씩
+    이어 붙이고(지우거나 덮어쓰지 않음), 각 페이지의 위치는 URL과 가져온
+    시각 기준으로 index.sqlite에 기록한다. 같은 URL의 직전 기록과 내용이
+    같으면 다시 저장하지 않는다.
+    세그먼트 파일은 페이지마다 버퍼만 비우고, fsync_every개마다와 세그먼트가
+    바뀔 때, close() 때 디스크에 동기화한 뒤 그 사이의 색인을 한 번에 커밋한다.
+    사이트 구조가 바뀌어 추출 규칙을 고친 뒤에는 reextract.py로 네트워크 없이
+    보관된 HTML에서 다시 추출할 수 있다.
+    """
+
+    def __init__(self, directory=DEFAULT_HTML_ARCHIVE_DIR, fsync_every=100):
+        self.directory = directory
+        self.fsync_every = max(1, int(fsync_every))
+        self.stats = Counter()
+        self._segment = None
+        self._file = None
+        self._unsynced = 0
+        self._segments_dir = os.path.join(directory, 'segments')
+        os.makedirs(self._segments_dir, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(directory, 'index.sqlite'))
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " id INTEGER PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " stage TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " segment TEXT NOT NULL,"
+            " offset INTEGER NOT NULL,"
+            " length INTEGER NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS pages_url ON pages (url, fetched_at)")
+        self.db.commit()
+
+    def add(self, url, stage, html):
+        """페이지 HTML 추가 (직전 기록과 같은 내용이면 건너뜀), 추가했으면 True"""
+        data = html.encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+        last = self.db.execute(
+            "SELECT content_hash FROM pages WHERE url = ? ORDER BY fetched_at DESC LIMIT 1", (url,)
+        ).fetchone()
+        if last is not None and last[0] == content_hash:
+            self.stats['unchanged'] += 1
+            return False
+
+        now = time.time()
+        segment = datetime.fromtimestamp(now).strftime('%Y%m%d') + '.gz'
+        member = gzip.compress(data)
+        f = self._segment_file(segment)
+        offset = f.tell()
+        f.write(member)
+        f.flush()
+
+        # 색인은 본문을 디스크에 동기화한 뒤에 커밋하므로 중간에 중단되어도 색인이 가리키는 데이터는 온전함
+        self.db.execute(
+            "INSERT INTO pages (url, stage, fetched_at, content_hash, segment, offset, length)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, stage, now, content_hash, segment, offset, len(member))
+        )
+        self.stats['stored'] += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+        return True
+
+    def _segment_file(self, segment):
+        """현재 세그먼트 파일 (날짜가 바뀌면 이전 세그먼트를 동기화하고 새 파일을 엶)"""
+        if segment != self._segment:
+            self.sync()
+            if self._file is not None:
+                self._file.close()
+            self._file = open(os.path.join(self._segments_dir, segment), 'ab')
+            self._segment = segment
+        return self._file
+
+    def sync(self):
+        """쓴 HTML을 디스크에 동기화하고 그 사이의 색인 커밋"""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self.db.commit()
+        self._unsynced = 0
+
+    def records(self, stage=None, latest_only=True):
+        """보관된 페이지 목록 [{'url', 'stage', 'fetched_at', 'segment', 'offset', 'length'}]
+
+        latest_only: URL마다 가장 최근에 가져온 기록만 반환
+        """
+        query = "SELECT url, stage, fetched_at, segment, offset, length FROM pages"
+        conditions, params = [], []
+        if stage is not None:
+            conditions.append("stage = ?")
+            params.append(stage)
+        if latest_only:
+            conditions.append(
+                "fetched_at = (SELECT MAX(p.fetched_at) FROM pages p WHERE p.url = pages.url)"
+            )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY fetched_at"
+        keys = ('url', 'stage', 'fetched_at', 'segment', 'offset', 'length')
+        return [dict(zip(keys, row)) for row in self.db.execute(query, params)]
+
+    def read(self, record):
+        """기록에 해당하는 HTML 반환"""
+        return read_record(self.directory, record)
+
+    def summary(self):
+        """보관 현황 요약 문자열"""
+        return f"새로 보관 {self.stats['stored']}개, 변경 없음 {self.stats['unchanged']}개"
+
+    def close(self):
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.db.close()
+
+
+def read_record(directory, record):
+    """보관소 폴더에서 기록 하나의 HTML 읽기 (다른 프로세스에서도 사용 가능)"""
+    with open(os.path.join(directory, 'segments', record['segment']), 'rb') as f:
+        f.seek(record['offset'])
+        member = f.read(record['length'])
+    return gzip.decompress(member).decode('utf-8')
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+브라우저 없이 HTML을 가져오는 HTTP 수집 모듈
+"""
+import aiohttp
+
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+)
+
+
+class HttpFetcher:
+    """keep-alive 연결을 재사용하는 비동기 HTTP 클라이언트
+
+    async with HttpFetcher() as fetcher:
+        html = await fetcher.fetch(url)
+    """
+
+    def __init__(self, max_connections=8, timeout=15, user_agent=DEFAULT_USER_AGENT):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.session = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+    async def start(self):
+        if self.session is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            keepalive_timeout=30,
+            ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={
+                'User-Agent': self.user_agent,
+                'Accept': 'text/html,application/xhtml+xml',
+                'Accept-Language': 'ko-KR,ko;q=0.9'
+            }
+        )
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def fetch(self, url):
+        """HTML 문자열 반환 (실패 시 None)"""
+        response = await self.fetch_response(url)
+        if response is None:
+            return None
+        status, html, _ = response
+        if status != 200:
+            print(f"  ✗ HTTP {status}: {url}")
+            return None
+        return html
+
+    async def fetch_response(self, url, headers=None, raise_errors=False):
+        """(상태 코드, HTML, 응답 헤더) 반환 (요청 실패 시 None, 헤더는 대소문자 구분 없음)
+
+        headers로 If-None-Match 등 조건부 요청 헤더를 넘길 수 있다.
+        raise_errors가 True면 요청 실패 시 None 대신 예외를 그대로 발생시킨다 (재시도 정책용).
+        """
+        try:
+            async with self.session.get(url, headers=headers) as response:
+                html = await response.text(errors='replace') if response.status == 200 else None
+                # 헤더는 대소문자 구분 없이 찾도록 aiohttp 헤더 객체 그대로 반환 (dict로 바꾸면 'ETag'를 못 찾음)
+                return response.status, html, response.headers
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"  ✗ HTTP 요청 실패: {e}")
+            return None
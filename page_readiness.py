@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+페이지 준비 완료 판단 모듈 (networkidle 대신 필요한 요소 기준)
+"""
+import time
+from collections import Counter
+
+from retry_policy import FetchError
+
+
+# 단계별로 추출에 필요한 요소 (모두 나타나면 준비 완료)
+DEFAULT_READY_SELECTORS = {
+    'list': ['li dd.registDate'],
+    'main': ['li.tab_item time'],
+    'article': ['div.fr-view, div.viewContent', 'ul.info-text'],
+}
+
+# 단계별 요소 대기 시간(초)
+DEFAULT_READY_TIMEOUTS = {
+    'list': 15.0,
+    'main': 15.0,
+    'article': 10.0,
+}
+
+
+class ReadinessPolicy:
+    """페이지 이동 후 추출에 필요한 DOM이 생기는 즉시 반환
+
+    광고나 분석 스크립트가 끝나기를 기다리지 않으므로 페이지당 대기 시간이
+    우리가 필요한 콘텐츠에만 좌우된다. 어떤 조건으로 끝났는지는 stats에
+    (단계, 조건) 단위로 기록된다.
+        selector: 필요한 요소가 모두 나타남
+        load: 요소 대기 시간이 지나 load 이벤트까지 기다림
+        timeout: load 이벤트도 오지 않아 현재 상태로 진행
+    """
+
+    def __init__(self, selectors=None, timeouts=None, navigation_timeout=30.0, load_timeout=5.0):
+        self.selectors = dict(DEFAULT_READY_SELECTORS)
+        self.selectors.update(selectors or {})
+        self.timeouts = dict(DEFAULT_READY_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+        self.navigation_timeout = navigation_timeout
+        self.load_timeout = load_timeout
+        self.stats = Counter()
+
+    async def goto(self, page, url, stage):
+        """페이지 이동 후 준비될 때까지 대기, 발생한 조건 반환
+
+        서버 오류(5xx)나 요청 제한(429) 응답이면 요소를 기다리지 않고 FetchError를 발생시킨다.
+        """
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=self.navigation_timeout * 1000)
+        if response is not None and response.status >= 500:
+            raise FetchError('5xx', f"HTTP {response.status}: {url}")
+        if response is not None and response.status == 429:
+            raise FetchError('429', f"HTTP 429: {url}")
+        return await self.wait(page, stage)
+
+    async def wait(self, page, stage):
+        """현재 페이지에서 stage에 필요한 요소를 기다림"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        deadline = time.monotonic() + self.timeouts.get(stage, 10.0)
+        condition = 'selector'
+        try:
+            # 여러 요소를 기다려도 전체 대기 시간은 단계별 제한을 넘지 않음
+            for selector in self.selectors.get(stage, []):
+                remaining_ms = max(1, (deadline - time.monotonic()) * 1000)
+                await page.wait_for_selector(selector, state='attached', timeout=remaining_ms)
+        except PlaywrightTimeoutError:
+            try:
+                await page.wait_for_load_state('load', timeout=self.load_timeout * 1000)
+                condition = 'load'
+            except PlaywrightTimeoutError:
+                condition = 'timeout'
+
+        self.stats[(stage, condition)] += 1
+        return condition
+
+    def summary(self):
+        """단계/조건별 횟수 요약 문자열"""
+        return ', '.join(
+            f"{stage}/{condition} {count}"
+            for (stage, condition), count in sorted(self.stats.items())
+        )
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+HTML 파싱/추출 작업 풀 모듈 (이벤트 루프 밖에서 파싱)
+"""
+import asyncio
+import os
+import threading
+
+from article_parser import get_parser
+
+
+# 작업 방식: 프로세스(모든 CPU 사용) 또는 스레드(C로 구현된 파서, 프로세스를 띄울 수 없는 환경)
+PARSE_EXECUTORS = ('process', 'thread')
+
+# 작업자(프로세스/스레드)마다 한 번만 만드는 파서
+_local = threading.local()
+
+
+def process_page(parser, html, stage):
+    """HTML을 파싱해 (추출에 필요한 요소가 있는지, 단계별 결과) 반환
+
+    결과는 프로세스 사이에 전달할 수 있는 기본 자료형이다.
+        list/main: 항목 목록 [{'href', 'date', 'title'}]
+        article: {'title', 'content', 'date', 'author', 'rules'}
+    """
+    doc = parser.parse(html, stage)
+    if stage == 'list':
+        result = parser.list_entries(doc)
+    elif stage == 'main':
+        result = parser.main_entries(doc)
+    else:
+        result = parser.extract_article(doc)
+    return parser.has_markup(doc, stage), result
+
+
+def _process_in_worker(parser_name, html, stage):
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = get_parser(parser_name)
+    return process_page(parser, html, stage)
+
+
+class ParsePool:
+    """페이지 HTML의 파싱과 기사 추출을 작업자 풀에서 실행
+
+    긴 기사를 파싱하는 동안에도 이벤트 루프가 멈추지 않으므로 다른 페이지의
+    요청/페이지 이동이 파싱 비용의 영향을 받지 않는다. 작업자 수는 기본값으로
+    CPU 수이고, 풀에 맡긴 작업이 max_pending개(기본값: 작업자 수의 2배)를 넘으면
+    process()가 기다리므로 파싱이 밀릴 때 수집도 함께 늦춰진다.
+    """
+
+    def __init__(self, parser='lxml', workers=None, executor='process', max_pending=None):
+        if executor not in PARSE_EXECUTORS:
+            raise ValueError(f"지원하지 않는 작업 방식입니다: {executor} (사용 가능: {', '.join(PARSE_EXECUTORS)})")
+        self.parser = parser
+        self.workers = workers if workers else (os.cpu_count() or 1)
+        self.executor_kind = executor
+        self.max_pending = max_pending if max_pending else self.workers * 2
+        self.processed = 0
+        self._executor = None
+        self._pending = asyncio.Semaphore(self.max_pending)
+
+    def _start(self):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if self._executor is None:
+            if self.executor_kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='parse')
+        return self._executor
+
+    async def process(self, html, stage):
+        """작업자에서 process_page를 실행하고 결과 반환"""
+        async with self._pending:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._start(), _process_in_worker, self.parser, html, stage)
+        self.processed += 1
+        return result
+
+    def summary(self):
+        kind = '프로세스' if self.executor_kind == 'process' else '스레드'
+        return f"{kind} {self.workers}개, 페이지 {self.processed}개 처리"
+
+    async def close(self):
+        """작업자 종료 (작업자가 끝날 때까지 이벤트 루프를 막지 않도록 별도 스레드에서 기다림)"""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+호스트별 요청 간격 제한 모듈
+"""
+import asyncio
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """같은 호스트로 가는 요청의 동시 실행 수와 시작 간격을 제한
+
+    여러 페이지가 동시에 기사를 가져오더라도 한 호스트에는
+    min_interval 초에 한 번 이상 요청이 시작되지 않도록 한다.
+    """
+
+    def __init__(self, min_interval=1.0, max_per_host=4):
+        self.min_interval = min_interval
+        self.max_per_host = max_per_host
+        self._semaphores = {}
+        self._locks = {}
+        self._next_start = {}
+
+    def _host(self, url):
+        return urlparse(url).netloc.lower()
+
+    def _semaphore(self, host):
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+            self._locks[host] = asyncio.Lock()
+            self._next_start[host] = 0.0
+        return self._semaphores[host]
+
+    async def acquire(self, url):
+        """요청 슬롯 확보 (필요하면 대기)"""
+        host = self._host(url)
+        await self._semaphore(host).acquire()
+        try:
+            async with self._locks[host]:
+                wait = self._next_start[host] - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_start[host] = time.monotonic() + self.min_interval
+        except BaseException:
+            self._semaphores[host].release()
+            raise
+
+    def release(self, url):
+        """요청 슬롯 반환"""
+        self._semaphores[self._host(url)].release()
+
+    def record(self, url, latency, status=None, error=None):
+        """요청 결과 기록 (고정 간격 제한에서는 사용하지 않음)"""
+
+    def slot(self, url):
+        """async with 구문에서 사용할 요청 슬롯"""
+        return _Slot(self, url)
+
+
+class _HostState:
+    """호스트별 현재 요청 속도와 동시 실행 한도"""
+
+    def __init__(self, rate, limit):
+        self.rate = rate
+        self.limit = limit
+        self.in_flight = 0
+        self.waiters = deque()
+        self.lock = asyncio.Lock()
+        self.next_start = 0.0
+        self.best_latency = None
+        self.smoothed_latency = None
+        self.hold_until = 0.0
+
+
+class AdaptiveRateLimiter(HostRateLimiter):
+    """서버 응답에 따라 요청 속도와 동시 실행 수를 자동으로 조절 (AIMD)
+
+    응답이 정상이고 빠르면 속도를 rate_step(건/초)씩, 동시 실행 한도를
+    한도만큼 성공할 때마다 1씩 올리고, 429/5xx 응답이나 요청 실패가 오거나
+    응답이 평소보다 느려지면(최근 평균 응답 시간이 가장 빠른 응답의
+    latency_tolerance배와 latency_slack초를 더한 값 중 큰 쪽, 또는 latency_target을
+    넘으면) 둘 다 decrease_factor배로 줄인다.
+    줄인 뒤 hold 초 동안은 동시에 끝난 요청들 때문에 다시 줄이지 않는다.
+    속도는 min_rate~max_rate, 동시 실행 수는 min_concurrency~max_concurrency 안에서 움직인다.
+    """
+
+    def __init__(self, min_rate=0.2, max_rate=10.0, initial_rate=1.0, rate_step=0.2,
+                 min_concurrency=1, max_concurrency=4, decrease_factor=0.5,
+                 latency_target=None, latency_tolerance=2.0, latency_slack=0.5, hold=1.0):
+        super().__init__(min_interval=1.0 / max_rate, max_per_host=max_concurrency)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.initial_rate = min(max(initial_rate, min_rate), max_rate)
+        self.rate_step = rate_step
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.latency_tolerance = latency_tolerance
+        self.latency_slack = latency_slack
+        self.hold = hold
+        self.increases = 0
+        self.decreases = 0
+        self._states = {}
+
+    def _state(self, host):
+        if host not in self._states:
+            self._states[host] = _HostState(self.initial_rate, float(self.min_concurrency))
+        return self._states[host]
+
+    def _wake(self, state):
+        """한도 안에서 기다리는 요청을 깨움"""
+        while state.waiters and state.in_flight < int(state.limit):
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                state.in_flight += 1
+                waiter.set_result(None)
+
+    def _release_state(self, state):
+        state.in_flight -= 1
+        self._wake(state)
+
+    async def acquire(self, url):
+        """동시 실행 한도와 현재 속도에 맞춰 요청 슬롯 확보"""
+        state = self._state(self._host(url))
+        if state.in_flight < int(state.limit) and not state.waiters:
+            state.in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            state.waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                if waiter.done() and not waiter.cancelled():
+                    self._release_state(state)
+                raise
+        try:
+            async with state.lock:
+                wait = state.next_start - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                state.next_start = time.monotonic() + 1.0 / state.rate
+        except BaseException:
+            self._release_state(state)
+            raise
+
+    def release(self, url):
+        self._release_state(self._state(self._host(url)))
+
+    def record(self, url, latency, status=None, error=None):
+        """요청 결과를 반영해 속도와 동시 실행 한도 조절"""
+        state = self._state(self._host(url))
+        now = time.monotonic()
+        congested = error is not None or (status is not None and (status == 429 or status >= 500))
+        if not congested and status in (None, 200):
+            # 304 등 본문 없는 응답은 응답 시간 판단에 넣지 않음
+            if state.best_latency is None:
+                state.best_latency = state.smoothed_latency = latency
+            else:
+                # 가장 빠른 응답 시간은 서서히 올라가도록 해서 사이트 상태 변화를 따라감
+                state.best_latency = min(latency, state.best_latency * 1.01)
+                state.smoothed_latency = state.smoothed_latency * 0.8 + latency * 0.2
+            target = self.latency_target
+            if target is None:
+                target = max(state.best_latency * self.latency_tolerance,
+                             state.best_latency + self.latency_slack)
+            congested = state.smoothed_latency > target
+
+        if congested:
+            if now >= state.hold_until:
+                state.rate = max(self.min_rate, state.rate * self.decrease_factor)
+                state.limit = max(self.min_concurrency, state.limit * self.decrease_factor)
+                state.hold_until = now + self.hold
+                self.decreases += 1
+        else:
+            state.rate = min(self.max_rate, state.rate + self.rate_step)
+            state.limit = min(self.max_concurrency, state.limit + 1.0 / state.limit)
+            self.increases += 1
+            self._wake(state)
+
+    def current(self, url):
+        """호스트의 현재 (요청 속도(건/초), 동시 실행 한도)"""
+        state = self._state(self._host(url))
+        return state.rate, int(state.limit)
+
+    def summary(self):
+        """호스트별 현재 속도와 조절 횟수 요약 문자열"""
+        hosts = ', '.join(
+            f"{host} {state.rate:.1f}건/초 동시 {int(state.limit)}"
+            for host, state in sorted(self._states.items())
+        )
+        return f"{hosts} (증가 {self.increases}회, 감소 {self.decreases}회)"
+
+
+class _Slot:
+    def __init__(self, limiter, url):
+        self.limiter = limiter
+        self.url = url
+        # 응답 상태 코드 (요청한 쪽에서 설정하면 속도 조절에 반영)
+        self.status = None
+        self.started = None
+
+    async def __aenter__(self):
+        await self.limiter.acquire(self.url)
+        self.started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            # 취소는 서버 상태와 관계없으므로 반영하지 않음
+            if exc_type is None or issubclass(exc_type, Exception):
+                self.limiter.record(self.url, time.monotonic() - self.started, self.status, exc)
+        finally:
+            self.limiter.release(self.url)
+        return False
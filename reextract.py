@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+보관된 원본 HTML에서 기사 정보를 다시 추출 (네트워크 사용 안 함)
+
+추출 규칙을 고친 뒤 다시 크롤링하지 않고 결과를 새로 만들 때 사용한다.
+
+    python reextract.py
+    python reextract.py --archive hanmi_html_archive --parser lxml --workers 4 --date 2026-02-01
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+
+from article_parser import PARSER_BACKENDS, get_parser
+from excel_writer import ExcelArticleWriter
+from html_archive import DEFAULT_HTML_ARCHIVE_DIR, HtmlArchive, read_record
+
+
+# 작업 프로세스마다 한 번만 만드는 파서
+_worker_parser = None
+
+
+def _init_worker(parser_name):
+    global _worker_parser
+    _worker_parser = get_parser(parser_name)
+
+
+def _extract(directory, record):
+    """보관된 기사 페이지 하나에서 기사 정보 추출"""
+    html = read_record(directory, record)
+    doc = _worker_parser.parse(html, 'article')
+    article = {'url': record['url']}
+    article.update(_worker_parser.extract_article(doc))
+    article['crawled_at'] = datetime.fromtimestamp(record['fetched_at']).isoformat()
+    return article
+
+
+def reextract(directory, parser_name='lxml', workers=None, target_date=None):
+    """보관소의 기사 페이지(URL별 최신)를 병렬로 다시 추출, (기사 목록, 규칙 통계) 반환
+
+    target_date: 'YYYY-MM-DD'를 주면 등록일시가 그 날짜인 기사만 반환
+    """
+    archive = HtmlArchive(directory)
+    try:
+        records = archive.records(stage='article')
+    finally:
+        archive.close()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(parser_name,)) as executor:
+        articles = list(executor.map(partial(_extract, directory), records, chunksize=16))
+
+    rules = Counter()
+    for article in articles:
+        for field, rule in article.pop('rules').items():
+            rules[(field, rule)] += 1
+
+    if target_date:
+        articles = [article for article in articles if (article.get('date') or '').startswith(target_date)]
+    return articles, rules
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="보관된 HTML에서 기사 정보 재추출")
+    arg_parser.add_argument('--archive', default=DEFAULT_HTML_ARCHIVE_DIR, help="원본 HTML 보관소 폴더")
+    arg_parser.add_argument('--parser', default='lxml', choices=PARSER_BACKENDS, help="HTML 파서 백엔드")
+    arg_parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본값: CPU 수)")
+    arg_parser.add_argument('--date', default=None, help="등록일이 이 날짜(YYYY-MM-DD)인 기사만 저장")
+    arg_parser.add_argument('--output', default=None, help="저장할 파일 이름(확장자 제외)")
+    args = arg_parser.parse_args()
+
+    if not os.path.isdir(args.archive):
+        print(f"✗ 보관소 폴더가 없습니다: {args.archive}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    articles, rules = reextract(args.archive, args.parser, args.workers, args.date)
+    elapsed = time.perf_counter() - started
+    print(f"✓ 기사 {len(articles)}개 재추출 완료 ({elapsed:.1f}초)")
+
+    if rules:
+        print("추출 규칙: " + ', '.join(f"{field}/{rule} {count}" for (field, rule), count in sorted(rules.items())))
+    if not articles:
+        return
+
+    output = args.output or f"hanmi_reextract_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    with open(output + '.json', 'w', encoding='utf-8') as f:
+        json.dump(articles, f, ensure_ascii=False, indent=2)
+    print(f"✓ JSON 파일 저장 완료: {output}.json")
+
+    with ExcelArticleWriter(output + '.xlsx') as writer:
+        for article in articles:
+            writer.write(article)
+    for filename in writer.filenames:
+        print(f"✓ 엑셀 파일 저장 완료: {filename}")
+
+
+if __name__ == "__main__":
+    main()
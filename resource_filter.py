@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+브라우저 요청 차단 모듈 (이미지, 폰트, 광고/분석 스크립트 등)
+"""
+from collections import Counter
+from urllib.parse import urlparse
+
+
+# 기본 차단 리소스 유형 (본문 추출에 필요 없음)
+DEFAULT_BLOCKED_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+# 기본 차단 호스트 (광고/분석, 하위 도메인 포함)
+DEFAULT_BLOCKED_HOSTS = {
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'googletagmanager.com',
+    'googletagservices.com',
+    'google-analytics.com',
+    'adservice.google.com',
+    'adservice.google.co.kr',
+    'facebook.net',
+    'connect.facebook.net',
+    'criteo.com',
+    'criteo.net',
+    'scorecardresearch.com',
+    'wcs.naver.net',
+    'mobon.net',
+    'dable.io',
+    'taboola.com',
+    'outbrain.com',
+    'adnxs.com',
+}
+
+
+def _host_matches(host, domains):
+    """host가 domains 중 하나이거나 그 하위 도메인인지 확인"""
+    for domain in domains:
+        if host == domain or host.endswith('.' + domain):
+            return True
+    return False
+
+
+class ResourceFilter:
+    """Playwright 컨텍스트에 설치하는 요청 필터
+
+    차단 규칙은 리소스 유형(image, font 등)과 호스트 목록으로 정하며,
+    allowed_* 목록에 있는 항목은 차단 목록보다 우선한다.
+    blocked_types/blocked_hosts를 주면 기본 목록을 대신하고, 기본 차단 호스트에
+    더하려면 extra_blocked_hosts를 사용한다.
+    차단한 요청 수는 blocked에 사유별로 기록된다.
+    """
+
+    def __init__(self, blocked_types=None, blocked_hosts=None, allowed_types=None, allowed_hosts=None,
+                 extra_blocked_hosts=None):
+        self.blocked_types = set(DEFAULT_BLOCKED_TYPES if blocked_types is None else blocked_types)
+        self.blocked_hosts = set(DEFAULT_BLOCKED_HOSTS if blocked_hosts is None else blocked_hosts)
+        self.blocked_hosts.update(extra_blocked_hosts or ())
+        self.allowed_types = set(allowed_types or ())
+        self.allowed_hosts = set(allowed_hosts or ())
+        self.blocked = Counter()
+        self.allowed = 0
+
+    def block_reason(self, resource_type, url):
+        """차단 사유 반환 (차단하지 않으면 None)"""
+        host = (urlparse(url).hostname or '').lower()
+        if _host_matches(host, self.allowed_hosts):
+            return None
+        if _host_matches(host, self.blocked_hosts):
+            return 'host'
+        if resource_type in self.blocked_types and resource_type not in self.allowed_types:
+            return resource_type
+        return None
+
+    async def install(self, context):
+        """브라우저 컨텍스트의 모든 요청에 필터 적용"""
+        await context.route('**/*', self._handle)
+
+    async def uninstall(self, context):
+        """install로 적용한 필터 해제 (계속 사용하는 컨텍스트용)"""
+        await context.unroute('**/*', self._handle)
+
+    async def _handle(self, route):
+        request = route.request
+        reason = self.block_reason(request.resource_type, request.url)
+        if reason:
+            self.blocked[reason] += 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    def summary(self):
+        """차단 현황 요약 문자열"""
+        details = ', '.join(f"{reason} {count}" for reason, count in self.blocked.most_common())
+        total = sum(self.blocked.values())
+        return f"차단 {total}개 ({details}), 허용 {self.allowed}개" if total else f"차단 0개, 허용 {self.allowed}개"
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+요청 재시도 정책 모듈 (오류 분류, 지수 백오프, 호스트별 차단기)
+"""
+import asyncio
+import random
+import time
+from collections import Counter, deque
+from urllib.parse import urlparse
+
+
+# 다시 시도할 오류 종류 (429: 요청이 너무 많음)
+RETRYABLE_KINDS = ('timeout', '5xx', '429', 'navigation', 'parse')
+
+# 호스트 상태 문제로 보는 오류 종류 (차단기 실패 횟수에 포함)
+HOST_ERROR_KINDS = ('timeout', '5xx', '429', 'navigation')
+
+# 추출 단계에서 페이지 내용이 덜 받아졌을 때 나는 오류
+# (AttributeError/KeyError/TypeError는 코드 오류일 가능성이 커서 다시 시도하지 않음)
+PARSE_ERROR_TYPES = (IndexError, ValueError)
+
+
+class FetchError(Exception):
+    """종류가 정해진 수집 오류 (kind: 'timeout', '5xx', '429', 'navigation', 'parse')"""
+
+    def __init__(self, kind, message):
+        super().__init__(message)
+        self.kind = kind
+
+
+def classify_error(error):
+    """예외를 'timeout', '5xx', '429', 'navigation', 'parse', 'other' 중 하나로 분류"""
+    if isinstance(error, FetchError):
+        return error.kind
+    # asyncio/aiohttp 시간 초과와 Playwright TimeoutError
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)) or type(error).__name__ == 'TimeoutError':
+        return 'timeout'
+    module = type(error).__module__ or ''
+    if module.startswith(('aiohttp', 'playwright')) or isinstance(error, ConnectionError):
+        return 'navigation'
+    if isinstance(error, PARSE_ERROR_TYPES):
+        return 'parse'
+    return 'other'
+
+
+def _host(url):
+    return urlparse(url).netloc.lower()
+
+
+class CircuitBreaker:
+    """호스트별 차단기
+
+    window 초 안에 같은 호스트에서 threshold번 실패하면 (사이에 성공한 요청이
+    있어도) cooldown 초 동안 그 호스트로 가는 요청을 모두 멈춘다.
+    다시 열린 뒤 성공하기 전에 또 실패하면 바로 다시 멈춘다.
+    """
+
+    def __init__(self, threshold=5, window=30.0, cooldown=30.0):
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self.trips = 0
+        self._failures = {}
+        self._open_until = {}
+        self._probing = set()
+
+    async def wait(self, url):
+        """호스트가 멈춘 상태면 다시 열릴 때까지 대기"""
+        host = _host(url)
+        while True:
+            remaining = self._open_until.get(host, 0.0) - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
+
+    def record_success(self, url):
+        self._probing.discard(_host(url))
+
+    def record_failure(self, url):
+        """실패 기록, 이번 실패로 호스트를 멈췄으면 True"""
+        host = _host(url)
+        now = time.monotonic()
+        if self._open_until.get(host, 0.0) > now:
+            return False  # 이미 멈춘 상태에서 끝난 요청
+
+        failures = self._failures.setdefault(host, deque())
+        failures.append(now)
+        while failures and failures[0] < now - self.window:
+            failures.popleft()
+        if len(failures) < self.threshold and host not in self._probing:
+            return False
+
+        failures.clear()
+        self._open_until[host] = now + self.cooldown
+        self._probing.add(host)
+        self.trips += 1
+        print(f"  ⚠️ {host} 요청 실패가 잦아 {self.cooldown:.0f}초 동안 요청을 멈춥니다")
+        return True
+
+
+class RetryPolicy:
+    """수집 요청 재시도 정책
+
+    재시도 가능한 오류(시간 초과, 5xx, 페이지 이동 실패, 추출 실패)는
+    최대 max_attempts번까지 시도하며, 시도 사이에는 지수적으로 늘어나는
+    상한(base_delay * 2^(n-1), 최대 max_delay) 안에서 무작위로 대기한다.
+    실패 횟수는 (단계, 오류 종류) 단위로 failures에 기록된다.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0,
+                 retry_on=RETRYABLE_KINDS, breaker=None):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = tuple(retry_on)
+        self.breaker = breaker if breaker else CircuitBreaker()
+        self.failures = Counter()
+        self.gave_up = Counter()
+        self.retries = 0
+
+    def backoff(self, attempt):
+        """attempt번째 실패 후 대기 시간(초)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    async def call(self, url, stage, operation):
+        """operation()(코루틴 함수)을 실행하고 재시도 가능한 오류면 대기 후 다시 시도
+
+        마지막 시도까지 실패하면 마지막 예외를 그대로 다시 발생시킨다.
+        """
+        attempt = 1
+        while True:
+            await self.breaker.wait(url)
+            try:
+                result = await operation()
+            except Exception as e:
+                kind = classify_error(e)
+                self.failures[(stage, kind)] += 1
+                if kind in HOST_ERROR_KINDS:
+                    self.breaker.record_failure(url)
+                if kind not in self.retry_on or attempt >= self.max_attempts:
+                    self.gave_up[(stage, kind)] += 1
+                    raise
+                delay = self.backoff(attempt)
+                print(f"  → {kind} 오류로 {delay:.1f}초 후 다시 시도 ({attempt}/{self.max_attempts - 1}): {e}")
+                self.retries += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success(url)
+                return result
+
+    def summary(self):
+        """재시도/실패 횟수 요약 문자열"""
+        parts = [f"재시도 {self.retries}회"]
+        if self.failures:
+            parts.append("실패 " + ', '.join(
+                f"{stage}/{kind} {count}" for (stage, kind), count in sorted(self.failures.items())
+            ))
+        if self.gave_up:
+            parts.append("최종 실패 " + ', '.join(
+                f"{stage}/{kind} {count}" for (stage, kind), count in sorted(self.gave_up.items())
+            ))
+        if self.breaker.trips:
+            parts.append(f"호스트 차단 {self.breaker.trips}회")
+        return ', '.join(parts)
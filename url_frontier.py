@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+수집할 기사 URL 관리 모듈 (URL 정규화, 중복 제거, 우선순위)
+"""
+import asyncio
+import hashlib
+import itertools
+import math
+import mmap
+import os
+import struct
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode, urlunparse
+
+
+# BloomFilter 파일 머리(식별자, 버전, capacity, 비트 수, 해시 수): 다른 설정으로 만든 파일을 구분
+BLOOM_FILE_MAGIC = b'HMBF'
+BLOOM_FILE_VERSION = 1
+_BLOOM_HEADER = struct.Struct('<4sHQQI6x')
+
+
+def article_idx(url):
+    """기사 URL의 정규화 키: idx 값 (없으면 정규화한 URL)"""
+    query = parse_qsl(urlparse(url).query, keep_blank_values=True)
+    for key, value in query:
+        if key == 'idx' and value:
+            return value
+    return canonical_url(url)
+
+
+def canonical_url(url, base_url=None):
+    """URL 정규화
+
+    상대 경로는 base_url 기준 절대 경로로 바꾸고, 스킴/호스트는 소문자로,
+    #fragment는 제거한다. 기사 URL(idx 파라미터)은 idx만 남기고(mcode 등 제거),
+    그 외 URL은 파라미터를 이름 순으로 정렬한다.
+    """
+    if base_url:
+        url = urljoin(base_url.rstrip('/') + '/', url)
+    parts = urlparse(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    idx = [value for key, value in query if key == 'idx' and value]
+    query = [('idx', idx[0])] if idx else sorted(query)
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', '', urlencode(query), ''))
+
+
+def newest_first(url):
+    """우선순위: idx가 클수록(최근 기사일수록) 먼저"""
+    idx = article_idx(url)
+    return -int(idx) if idx.isdigit() else 0
+
+
+class BloomFilter:
+    """메모리를 적게 쓰는 집합 (없는 키를 있다고 판단할 확률 error_rate)
+
+    긴 기간을 수집할 때 URL 집합 대신 사용한다. path를 주면 비트 배열을
+    디스크 파일에 매핑하므로 실행이 끝나도 남고, 같은 파일로 다시 실행하면
+    이전에 넣은 키를 이미 본 것으로 처리한다 (중단된 기간 수집 이어 하기).
+    파일 머리에 capacity/error_rate로 정한 비트 수와 해시 수를 기록해 두고, 다른 설정으로
+    만든 파일(또는 BloomFilter 파일이 아닌 파일)을 열면 ValueError를 발생시킨다.
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001, path=None):
+        self.capacity = int(capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        num_bytes = (self.num_bits + 7) // 8
+        self.path = path
+        self._file = None
+        self._offset = 0
+        if path:
+            header = _BLOOM_HEADER.pack(BLOOM_FILE_MAGIC, BLOOM_FILE_VERSION,
+                                        self.capacity, self.num_bits, self.num_hashes)
+            self._file = open(path, 'a+b')
+            size = os.path.getsize(path)
+            if size == 0:
+                # 새 파일: 머리를 쓰고 비트 배열은 0으로 채움
+                self._file.write(header)
+                self._file.truncate(len(header) + num_bytes)
+                self._file.flush()
+            else:
+                self._file.seek(0)
+                existing = self._file.read(len(header))
+                if existing != header or size != len(header) + num_bytes:
+                    self._file.close()
+                    self._file = None
+                    raise ValueError(f"{path}: 다른 설정으로 만든 BloomFilter 파일입니다 "
+                                     f"(capacity={self.capacity}, error_rate={error_rate}와 맞지 않음, "
+                                     f"같은 설정으로 열거나 파일을 지우세요)")
+            self._offset = len(header)
+            self._bits = mmap.mmap(self._file.fileno(), len(header) + num_bytes)
+        else:
+            self._bits = bytearray(num_bytes)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(str(key).encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key):
+        offset = self._offset
+        return all(self._bits[offset + (pos >> 3)] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key):
+        offset = self._offset
+        for pos in self._positions(key):
+            self._bits[offset + (pos >> 3)] |= 1 << (pos & 7)
+
+    def empty_copy(self):
+        """같은 크기/오류율의 빈 메모리 BloomFilter"""
+        return BloomFilter(self.capacity, self.error_rate)
+
+    def close(self):
+        if self._file is not None:
+            self._bits.flush()
+            self._bits.close()
+            self._file.close()
+            self._file = None
+
+
+class UrlFrontier:
+    """수집할 기사 URL 대기열
+
+    URL을 정규화 키(idx)로 중복 제거하고(집합 또는 BloomFilter), priority 함수
+    (기본값: 최신 기사 먼저) 순서로 꺼낸다. maxsize를 넘으면 put이 기다리므로
+    목록 탐색이 상세 수집보다 너무 앞서 나가지 않는다.
+    close() 후에는 남은 URL을 모두 꺼낸 뒤 async for 순회가 끝난다.
+    history(BloomFilter 등)를 주면 거기 있는 기사도 건너뛰고, history에는
+    mark_done()으로 수집을 마친 기사만 기록한다 (발견만 한 기사는 다음 실행에서 다시 수집).
+    """
+
+    def __init__(self, maxsize=0, seen=None, priority=newest_first, history=None):
+        self.seen = seen if seen is not None else set()
+        self.history = history
+        self.priority = priority
+        self.added = 0
+        self.duplicates = 0
+        self._queue = asyncio.PriorityQueue(maxsize)
+        self._order = itertools.count()
+
+    def add(self, url):
+        """처음 보는 기사면 기록하고 True, 이미 봤거나 history에 있는 기사면 False"""
+        key = article_idx(url)
+        if key in self.seen or (self.history is not None and key in self.history):
+            self.duplicates += 1
+            return False
+        self.seen.add(key)
+        self.added += 1
+        return True
+
+    def mark_done(self, url):
+        """수집을 마친 기사를 history에 기록"""
+        if self.history is not None:
+            self.history.add(article_idx(url))
+
+    async def put(self, url):
+        """수집 대기열에 넣음 (가득 차면 대기)"""
+        await self._queue.put((self.priority(url), next(self._order), url))
+
+    async def close(self):
+        """더 넣을 URL이 없음을 알림 (남은 URL보다 뒤에 꺼내짐)"""
+        await self._queue.put((math.inf, next(self._order), None))
+
+    async def __aiter__(self):
+        while True:
+            _, _, url = await self._queue.get()
+            if url is None:
+                return
+            yield url